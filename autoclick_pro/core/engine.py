@@ -1,11 +1,32 @@
 from __future__ import annotations
 
+import os
 import threading
-import time
-from typing import Callable, Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple, Optional
 
+import cv2
+import numpy as np
+
+from autoclick_pro.data.model import sanitize_action
+from autoclick_pro.detect.feature_matcher import FeatureMatchResult, feature_match_array, load_template_features
+from autoclick_pro.detect.template_matcher import MatchResult, match_template_array, match_template_batch
 from autoclick_pro.input.simulator import Mouse, Keyboard
 from autoclick_pro.logging.logger import get_logger
+from autoclick_pro.util.screen import grab_region_gray, grab_screen_array, primary_monitor
+
+
+class _Timeline(NamedTuple):
+    """Compiled actions as parallel per-field tuples, indexed by action position."""
+
+    handlers: tuple[Callable[..., int | None], ...]
+    actions: tuple[dict, ...]
+    params: tuple[dict, ...]
+    delays_before: tuple[float, ...]  # seconds
+    delays_after: tuple[float, ...]  # seconds
+    repeats: tuple[int, ...]
+    jump_table: dict[str, int]  # action id / label name -> index
 
 
 class Engine:
@@ -18,7 +39,9 @@ class Engine:
         self._log = get_logger()
         self._worker: Optional[threading.Thread] = None
         self._stop = threading.Event()
-        self._pause = threading.Event()
+        # Set while the engine may run; cleared on pause so the worker blocks in wait()
+        self._resume = threading.Event()
+        self._resume.set()
         self._simulation = True
         self._on_status: Optional[Callable[[str], None]] = None
 
@@ -26,6 +49,14 @@ class Engine:
         self.mouse = Mouse()
         self.keyboard = Keyboard()
 
+        # Detection state: reusable frame buffers keyed by grayscale or not, and
+        # decoded templates keyed by (path, imread flags). Screen handles come from
+        # util.screen, one per thread, closed when the run's worker thread exits
+        self._frame_bufs: dict[bool, np.ndarray] = {}
+        self._tmpl_cache: dict[tuple[str, int], Optional[np.ndarray]] = {}
+        # Fan-out pool for detect_any; created on first use
+        self._detect_pool: Optional[ThreadPoolExecutor] = None
+
     # Control
 
     def set_simulation(self, enabled: bool) -> None:
@@ -41,25 +72,31 @@ class Engine:
             self._log.warning("engine_already_running")
             return
         self._stop.clear()
-        self._pause.clear()
+        self._resume.set()
         self._context = {"last_detect": None}
-        self._worker = threading.Thread(target=self._run, args=(list(actions),), daemon=True)
+        # Templates may be re-captured between runs; decode them afresh per run
+        self._tmpl_cache.clear()
+        timeline = self._compile(list(actions))
+        self._worker = threading.Thread(target=self._run, args=(timeline,), daemon=True)
         self._worker.start()
 
     def pause(self) -> None:
-        self._pause.set()
+        self._resume.clear()
         self._emit("Paused")
 
     def resume(self) -> None:
-        self._pause.clear()
+        self._resume.set()
         self._emit("Resumed")
 
     def stop(self) -> None:
         self._stop.set()
+        # Wake a paused worker so it observes the stop immediately
+        self._resume.set()
         self._emit("Stopped")
 
     def estop(self) -> None:
         self._stop.set()
+        self._resume.set()
         # Optionally add low-level abort hooks if using OS APIs
         self._emit("EMERGENCY STOP")
 
@@ -69,31 +106,87 @@ class Engine:
         if self._on_status:
             self._on_status(msg)
 
-    def _run(self, actions: list[dict]) -> None:
-        self._emit("Running")
-        # Build index mapping for jumps and labels
+    def _sleep(self, seconds: float) -> None:
+        """Interruptible sleep: returns early as soon as stop is requested."""
+        if seconds > 0:
+            self._stop.wait(seconds)
+
+    def _compile(self, actions: list[dict]) -> _Timeline:
+        """
+        Resolve every action once into per-field columns (handler, params, delays in
+        seconds, repeat) plus the jump table, so the run loop does no type dispatch,
+        dict lookups or field coercion. Numeric params are coerced here as well
+        (sanitize_action), so handlers read them as-is.
+        """
+        handlers: list[Callable[..., int | None]] = []
+        params_col: list[dict] = []
+        delays_before: list[float] = []
+        delays_after: list[float] = []
+        repeats: list[int] = []
         id_to_index: dict[str, int] = {}
         label_to_index: dict[str, int] = {}
         for i, a in enumerate(actions):
-            aid = str(a.get("id") or "")
+            clean = sanitize_action(a)
+            handler = self._HANDLERS.get(clean["type"], Engine._do_unknown)
+            params = clean["params"]
+            repeat = clean["repeat_count"]
+            # Repeated waits become one longer (still interruptible) sleep instead
+            # of a handler call per repetition. Repeated clicks stay separate calls
+            # so stop is checked, and pyautogui pauses, between them
+            if repeat > 1 and handler is Engine._do_wait:
+                params, repeat = {**params, "ms": params.get("ms", 0) * repeat}, 1
+            # Detect targets resolved once: str for the decoded-template cache, Path for features
+            if handler is Engine._do_detect:
+                target = str(a.get("target"))
+                params = {
+                    **params,
+                    "_target": target,
+                    "_target_path": Path(target),
+                    "_method": params.get("method", "template"),
+                    "_gray": bool(params.get("gray", False)),
+                }
+            elif handler is Engine._do_detect_any:
+                targets = [str(t) for t in params.get("targets", [])]
+                if a.get("target"):
+                    targets.insert(0, str(a["target"]))
+                params = {**params, "_targets": targets}
+            handlers.append(handler)
+            params_col.append(params)
+            delays_before.append(clean["delay_before_ms"] / 1000.0)
+            delays_after.append(clean["delay_after_ms"] / 1000.0)
+            repeats.append(repeat)
+
+            aid = clean["id"]
             if aid:
                 id_to_index[aid] = i
-            if a.get("type") == "label":
+            if clean["type"] == "label":
                 lname = str(a.get("target") or aid)
                 if lname:
                     label_to_index[lname] = i
 
+        return _Timeline(
+            tuple(handlers),
+            tuple(actions),
+            tuple(params_col),
+            tuple(delays_before),
+            tuple(delays_after),
+            tuple(repeats),
+            # Labels shadow ids of the same name
+            {**id_to_index, **label_to_index},
+        )
+
+    def _run(self, timeline: _Timeline) -> None:
+        self._emit("Running")
         i = 0
+        n = len(timeline.actions)
         loop_iters: dict[int, int] = {}
-        while i < len(actions):
+        while i < n:
+            self._resume.wait()
             if self._stop.is_set():
                 break
-            while self._pause.is_set() and not self._stop.is_set():
-                time.sleep(0.05)
 
-            action = actions[i]
             try:
-                next_idx = self._execute(action, id_to_index=id_to_index | label_to_index, current_index=i, actions=actions, loop_iters=loop_iters)
+                next_idx = self._execute(timeline, i, loop_iters)
             except Exception as e:
                 self._log.error("engine_action_error", index=i, error=str(e))
                 break
@@ -105,143 +198,200 @@ class Engine:
 
         self._emit("Idle")
 
-    def _execute(self, action: dict, *, id_to_index: dict[str, int] | None = None, current_index: int | None = None, actions: list[dict] | None = None, loop_iters: dict[int, int] | None = None) -> int | None:
-        t = action.get("type")
-        params = action.get("params", {})
-        delay_before = int(action.get("delay_before_ms", 0))
-        delay_after = int(action.get("delay_after_ms", 0))
-        repeat = int(action.get("repeat_count", 1))
+    def _grab_frame(self, gray: bool) -> np.ndarray:
+        """Grab the primary monitor into a reused BGR (or grayscale) buffer."""
+        buf = self._frame_bufs.get(gray)
+        # The buffer is refilled in place; cvtColor replaces it if the screen size changed
+        if gray:
+            frame = grab_region_gray(*primary_monitor(), dst=buf)
+        else:
+            frame = grab_screen_array(dst=buf)
+        self._frame_bufs[gray] = frame
+        return frame
+
+    def _template(self, path: str, flags: int) -> Optional[np.ndarray]:
+        key = (path, flags)
+        if key not in self._tmpl_cache:
+            self._tmpl_cache[key] = cv2.imread(path, flags)
+        return self._tmpl_cache[key]
+
+    def _execute(self, timeline: _Timeline, i: int, loop_iters: dict[int, int]) -> int | None:
+        handler = timeline.handlers[i]
+        action = timeline.actions[i]
+        params = timeline.params[i]
+        jump_table = timeline.jump_table
+        delay_before = timeline.delays_before[i]
+        delay_after = timeline.delays_after[i]
 
         if delay_before:
-            time.sleep(delay_before / 1000.0)
+            self._sleep(delay_before)
 
-        for _ in range(max(1, repeat)):
+        for _ in range(timeline.repeats[i]):
             if self._stop.is_set():
                 break
-
-            if t == "wait":
-                ms = int(params.get("ms", 0))
-                time.sleep(ms / 1000.0)
-
-            elif t == "mouse_click":
-                x = params.get("x")
-                y = params.get("y")
-                button = params.get("button", "left")
-                if not self._simulation:
-                    self.mouse.click(x, y, button)
-                self._log.info("mouse_click", x=x, y=y, button=button)
-
-            elif t == "key_sequence":
-                seq = params.get("sequence", [])
-                text_mode = params.get("text_mode", True)
-                if not self._simulation:
-                    if text_mode:
-                        self.keyboard.type_text_sequence(seq)
-                    else:
-                        self.keyboard.press_keys(seq)
-                self._log.info("key_sequence", sequence=seq, text_mode=text_mode)
-
-            elif t == "detect":
-                # Capture current screen and run template match or feature match
-                from pathlib import Path
-                from autoclick_pro.util.screen import grab_screen
-                from autoclick_pro.detect.template_matcher import match_template
-                from autoclick_pro.detect.feature_matcher import feature_match
-
-                tmpl = action.get("target")
-                conf = float(params.get("conf", 0.85))
-                method = params.get("method", "template")
-                screen_path = grab_screen()
-                if method == "feature":
-                    res = feature_match(Path(screen_path), Path(str(tmpl)), confidence_threshold=conf)
-                    # Normalize to first/best candidate
-                    best = res.candidates[0] if res.candidates else None
-                    found = best is not None and best.score >= conf
-                    bbox = best.bbox if best else None
-                    score = best.score if best else 0.0
-                    self._log.info("detect_result_feature", target=tmpl, found=found, score=score, bbox=bbox, candidates=len(res.candidates))
-                    self._context["last_detect"] = {"found": found, "bbox": bbox, "score": score, "candidates": [c.to_dict() for c in res.candidates]}
-                else:
-                    res = match_template(Path(screen_path), Path(str(tmpl)), confidence_threshold=conf)
-                    self._log.info("detect_result", target=tmpl, found=res.found, score=res.score, bbox=res.bbox)
-                    self._context["last_detect"] = {"found": res.found, "bbox": res.bbox, "score": res.score}
-                action.setdefault("result", self._context["last_detect"])
-
-            elif t == "conditional_jump":
-                # Example params:
-                # {"test": "last_detect", "true_target": "a5", "false_target": "a10"}
-                test = params.get("test", "last_detect")
-                true_target = params.get("true_target")
-                false_target = params.get("false_target")
-                cond = False
-                if test == "last_detect":
-                    ld = self._context.get("last_detect")
-                    cond = bool(ld and ld.get("found"))
-                elif isinstance(test, str) and test.startswith("var:"):
-                    # Optional future var check
-                    name = test.split(":", 1)[1]
-                    cond = bool(self._context.get(name))
-                # Determine next index
-                target_id = true_target if cond else false_target
-                if target_id and id_to_index and target_id in id_to_index:
-                    next_index = id_to_index[target_id]
-                    self._log.info("conditional_jump", cond=cond, target=target_id, index=next_index)
-                    # return next index for outer loop to jump
-                    return next_index
-                else:
-                    self._log.info("conditional_jump_no_target", cond=cond)
-                    # fall-through (continue to next action)
-
-            elif t == "label":
-                # No-op; labels are jump targets
-                self._log.info("label", name=action.get("target") or action.get("id"))
-
-            elif t == "loop_until":
-                # Params:
-                # {"label": "start", "until": {"test": "last_detect", "value": True}, "max_iters": 100}
-                label = params.get("label")
-                until = params.get("until", {"test": "last_detect", "value": True})
-                max_iters = int(params.get("max_iters", 100))
-                # Evaluate condition
-                test = until.get("test", "last_detect")
-                value = until.get("value", True)
-                cond = False
-                if test == "last_detect":
-                    ld = self._context.get("last_detect")
-                    cond = bool(ld and bool(ld.get("found")) == bool(value))
-                elif isinstance(test, str) and test.startswith("var:"):
-                    name = test.split(":", 1)[1]
-                    cond = bool(self._context.get(name)) == bool(value)
-
-                idx_key = int(current_index if current_index is not None else -1)
-                if loop_iters is not None:
-                    count = loop_iters.get(idx_key, 0)
-                else:
-                    count = 0
-
-                if cond:
-                    self._log.info("loop_until_condition_met", label=label, iters=count)
-                    # continue to next action
-                    return None
-                elif count >= max_iters:
-                    self._log.warning("loop_until_max_iters", label=label, max_iters=max_iters)
-                    return None
-                else:
-                    # increment and jump to label
-                    if loop_iters is not None:
-                        loop_iters[idx_key] = count + 1
-                    if label and id_to_index and label in id_to_index:
-                        next_index = id_to_index[label]
-                        self._log.info("loop_until_jump", label=label, next_index=next_index, iters=loop_iters.get(idx_key, 0))
-                        return next_index
-                    else:
-                        self._log.warning("loop_until_label_not_found", label=label)
-                        return None
-
-            else:
-                self._log.warning("unknown_action_type", type=t)
+            next_index = handler(self, action, params, jump_table, i, loop_iters)
+            if next_index is not None:
+                # return next index for outer loop to jump
+                return next_index
 
         if delay_after:
-            time.sleep(delay_after / 1000.0)
-
-        return None
\ No newline at end of file
+            self._sleep(delay_after)
+
+        return None
+
+    # Action handlers: (engine, action, params, id_to_index, current_index, loop_iters) -> jump index or None
+
+    def _do_wait(self, action: dict, params: dict, id_to_index: dict[str, int], current_index: int, loop_iters: dict[int, int]) -> int | None:
+        ms = params.get("ms", 0)
+        self._sleep(ms / 1000.0)
+        return None
+
+    def _do_mouse_click(self, action: dict, params: dict, id_to_index: dict[str, int], current_index: int, loop_iters: dict[int, int]) -> int | None:
+        x = params.get("x")
+        y = params.get("y")
+        button = params.get("button", "left")
+        clicks = params.get("clicks", 1)
+        if not self._simulation:
+            self.mouse.click(x, y, button, clicks=clicks)
+        self._log.info("mouse_click", x=x, y=y, button=button, clicks=clicks)
+        return None
+
+    def _do_key_sequence(self, action: dict, params: dict, id_to_index: dict[str, int], current_index: int, loop_iters: dict[int, int]) -> int | None:
+        seq = params.get("sequence", [])
+        text_mode = params.get("text_mode", True)
+        if not self._simulation:
+            if text_mode:
+                self.keyboard.type_text_sequence(seq)
+            else:
+                self.keyboard.press_keys(seq)
+        self._log.info("key_sequence", sequence=seq, text_mode=text_mode)
+        return None
+
+    def _do_detect(self, action: dict, params: dict, id_to_index: dict[str, int], current_index: int, loop_iters: dict[int, int]) -> int | None:
+        # Capture current screen and run template match or feature match
+        tmpl = params["_target"]
+        conf = params.get("conf", 0.85)
+        if params["_method"] == "feature":
+            features = load_template_features(params["_target_path"])
+            if features is None:
+                res = FeatureMatchResult([])
+            else:
+                res = feature_match_array(self._grab_frame(gray=True), features, confidence_threshold=conf)
+            # Normalize to first/best candidate
+            best = res.candidates[0] if res.candidates else None
+            found = best is not None and best.score >= conf
+            bbox = best.bbox if best else None
+            score = best.score if best else 0.0
+            self._log.info("detect_result_feature", target=tmpl, found=found, score=score, bbox=bbox, candidates=len(res.candidates))
+            self._context["last_detect"] = {"found": found, "bbox": bbox, "score": score, "candidates": [c.to_dict() for c in res.candidates]}
+        else:
+            # "gray": true matches single-channel frame and template (colour-blind, ~3x less data)
+            gray = params["_gray"]
+            tmpl_img = self._template(tmpl, cv2.IMREAD_GRAYSCALE if gray else cv2.IMREAD_COLOR)
+            if tmpl_img is None:
+                res = MatchResult(False, None, 0.0)
+            else:
+                res = match_template_array(self._grab_frame(gray=gray), tmpl_img, confidence_threshold=conf)
+            self._log.info("detect_result", target=tmpl, found=res.found, score=res.score, bbox=res.bbox)
+            self._context["last_detect"] = {"found": res.found, "bbox": res.bbox, "score": res.score}
+        action.setdefault("result", self._context["last_detect"])
+        return None
+
+    def _do_detect_any(self, action: dict, params: dict, id_to_index: dict[str, int], current_index: int, loop_iters: dict[int, int]) -> int | None:
+        # Params:
+        # {"targets": ["a.png", "b.png"], "conf": 0.85}
+        # One screen grab matched against every template; the best found one wins.
+        targets = params["_targets"]
+        conf = params.get("conf", 0.85)
+        loaded = [(t, img) for t in targets if (img := self._template(t, cv2.IMREAD_COLOR)) is not None]
+        best: dict = {"found": False, "bbox": None, "score": 0.0, "target": None}
+        if loaded:
+            if self._detect_pool is None:
+                self._detect_pool = ThreadPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2), thread_name_prefix="detect")
+            frame = self._grab_frame(gray=False)
+            results = match_template_batch(frame, [img for _, img in loaded], confidence_threshold=conf, executor=self._detect_pool)
+            for (t, _), res in zip(loaded, results):
+                if (res.found, res.score) > (best["found"], best["score"]):
+                    best = {"found": res.found, "bbox": res.bbox, "score": res.score, "target": t}
+        self._log.info("detect_any_result", targets=len(targets), found=best["found"], score=best["score"], target=best["target"])
+        self._context["last_detect"] = best
+        action.setdefault("result", best)
+        return None
+
+    def _do_conditional_jump(self, action: dict, params: dict, id_to_index: dict[str, int], current_index: int, loop_iters: dict[int, int]) -> int | None:
+        # Example params:
+        # {"test": "last_detect", "true_target": "a5", "false_target": "a10"}
+        test = params.get("test", "last_detect")
+        true_target = params.get("true_target")
+        false_target = params.get("false_target")
+        cond = False
+        if test == "last_detect":
+            ld = self._context.get("last_detect")
+            cond = bool(ld and ld.get("found"))
+        elif isinstance(test, str) and test.startswith("var:"):
+            # Optional future var check
+            name = test.split(":", 1)[1]
+            cond = bool(self._context.get(name))
+        # Determine next index
+        target_id = true_target if cond else false_target
+        if target_id and target_id in id_to_index:
+            next_index = id_to_index[target_id]
+            self._log.info("conditional_jump", cond=cond, target=target_id, index=next_index)
+            return next_index
+        self._log.info("conditional_jump_no_target", cond=cond)
+        # fall-through (continue to next action)
+        return None
+
+    def _do_label(self, action: dict, params: dict, id_to_index: dict[str, int], current_index: int, loop_iters: dict[int, int]) -> int | None:
+        # No-op; labels are jump targets
+        self._log.info("label", name=action.get("target") or action.get("id"))
+        return None
+
+    def _do_loop_until(self, action: dict, params: dict, id_to_index: dict[str, int], current_index: int, loop_iters: dict[int, int]) -> int | None:
+        # Params:
+        # {"label": "start", "until": {"test": "last_detect", "value": True}, "max_iters": 100}
+        label = params.get("label")
+        until = params.get("until", {"test": "last_detect", "value": True})
+        max_iters = params.get("max_iters", 100)
+        # Evaluate condition
+        test = until.get("test", "last_detect")
+        value = until.get("value", True)
+        cond = False
+        if test == "last_detect":
+            ld = self._context.get("last_detect")
+            cond = bool(ld and bool(ld.get("found")) == bool(value))
+        elif isinstance(test, str) and test.startswith("var:"):
+            name = test.split(":", 1)[1]
+            cond = bool(self._context.get(name)) == bool(value)
+
+        count = loop_iters.get(current_index, 0)
+        if cond:
+            self._log.info("loop_until_condition_met", label=label, iters=count)
+            # continue to next action
+            return None
+        if count >= max_iters:
+            self._log.warning("loop_until_max_iters", label=label, max_iters=max_iters)
+            return None
+        # increment and jump to label
+        loop_iters[current_index] = count + 1
+        if label and label in id_to_index:
+            next_index = id_to_index[label]
+            self._log.info("loop_until_jump", label=label, next_index=next_index, iters=count + 1)
+            return next_index
+        self._log.warning("loop_until_label_not_found", label=label)
+        return None
+
+    def _do_unknown(self, action: dict, params: dict, id_to_index: dict[str, int], current_index: int, loop_iters: dict[int, int]) -> int | None:
+        self._log.warning("unknown_action_type", type=action.get("type"))
+        return None
+
+    _HANDLERS: dict[str, Callable[..., int | None]] = {
+        "wait": _do_wait,
+        "mouse_click": _do_mouse_click,
+        "key_sequence": _do_key_sequence,
+        "detect": _do_detect,
+        "detect_any": _do_detect_any,
+        "conditional_jump": _do_conditional_jump,
+        "label": _do_label,
+        "loop_until": _do_loop_until,
+    }
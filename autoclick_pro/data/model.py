@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     id: str
     type: str
@@ -13,6 +13,83 @@ class Action:
     delay_before_ms: int = 0
     delay_after_ms: int = 0
     repeat_count: int = 1
+    # Rendered timeline label and params JSON; cleared by whoever mutates the action
+    _display_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _params_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain dict of the persisted fields, as the engine and project files take it."""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "target": self.target,
+            "params": self.params,
+            "delay_before_ms": self.delay_before_ms,
+            "delay_after_ms": self.delay_after_ms,
+            "repeat_count": self.repeat_count,
+        }
+
+    @classmethod
+    def from_dict(cls, a: dict[str, Any]) -> Action:
+        """
+        Build from a persisted dict with the same coercions as sanitize_action,
+        but without the intermediate dict, and skipping conversions for values
+        that already have the right type (as parsed JSON normally does).
+        """
+        get = a.get
+        ident, type_ = get("id") or "", get("type") or ""
+        before, after = get("delay_before_ms") or 0, get("delay_after_ms") or 0
+        repeat = get("repeat_count") or 1
+        return cls(
+            ident if type(ident) is str else str(ident),
+            type_ if type(type_) is str else str(type_),
+            get("target"),
+            _coerce_params(get("params") or {}),
+            before if type(before) is int else int(before),
+            after if type(after) is int else int(after),
+            max(1, repeat if type(repeat) is int else int(repeat)),
+        )
+
+
+# Numeric action params and their types; coerced once by sanitize_action
+_NUMERIC_PARAMS: dict[str, type] = {
+    "ms": int,
+    "x": int,
+    "y": int,
+    "clicks": int,
+    "conf": float,
+    "max_iters": int,
+}
+
+
+def _coerce_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Copy of params with the numeric ones converted; values that fail to convert are left as-is."""
+    params = dict(params)
+    for key, conv in _NUMERIC_PARAMS.items():
+        val = params.get(key)
+        if val is not None and type(val) is not conv:
+            try:
+                params[key] = conv(val)
+            except (TypeError, ValueError):
+                pass
+    return params
+
+
+def sanitize_action(a: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return a copy of an action dict with timing fields and numeric params coerced
+    to their types, so consumers can use them without per-access int()/float().
+    Params that fail to convert are left as-is.
+    """
+    return {
+        **a,
+        "id": str(a.get("id") or ""),
+        "type": str(a.get("type") or ""),
+        "params": _coerce_params(a.get("params") or {}),
+        "delay_before_ms": int(a.get("delay_before_ms") or 0),
+        "delay_after_ms": int(a.get("delay_after_ms") or 0),
+        "repeat_count": max(1, int(a.get("repeat_count") or 1)),
+    }
 
 
 @dataclass
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import functools
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
 
 from autoclick_pro.util.nms import non_max_suppression
 
+# Templates whose longest side exceeds this are matched on a pyrDown level
+_DOWNSAMPLE_ABOVE_PX = 256
+
 
 @dataclass
 class Candidate:
@@ -25,19 +30,232 @@ class FeatureMatchResult:
     candidates: List[Candidate]
 
 
+@dataclass(frozen=True)
+class TemplateFeatures:
+    # Plain arrays only (no cv2.KeyPoint objects), so entries stay small and picklable
+    descriptors: Optional[np.ndarray]
+    points: np.ndarray  # (N, 2) float32 keypoint coordinates in full-resolution pixels
+    shape: Tuple[int, int]  # (h, w) of the full-resolution template
+    corners: np.ndarray  # (4, 3) homogeneous template box corners
+    scale: float  # multiply keypoint coords by this to get full-resolution pixels
+    method: str
+
+
+# Detectors are not safe to share between threads (engine worker vs. UI inspector)
+_tls = threading.local()
+
+
+def _keypoint_coords(kp) -> np.ndarray:
+    if not kp:
+        return np.empty((0, 2), dtype=np.float32)
+    return cv2.KeyPoint_convert(kp).reshape(-1, 2)
+
+
+def _orb_budget(shape: Tuple[int, ...], per_px: int, lo: int, hi: int) -> int:
+    # ORB and the descriptor match scale linearly with feature count; a small
+    # button template needs a few hundred at most for a 4-point homography
+    return max(lo, min(hi, int(shape[0] * shape[1]) // per_px))
+
+
+def _detector(method: str, nfeatures: int = 2000):
+    dets = getattr(_tls, "detectors", None)
+    if dets is None:
+        dets = _tls.detectors = {}
+    key = (method, 0 if method == "AKAZE" else nfeatures)
+    det = dets.get(key)
+    if det is None:
+        if method == "AKAZE":
+            det = cv2.AKAZE_create()
+        else:
+            det = cv2.ORB_create(nfeatures=nfeatures, scaleFactor=1.3, nlevels=4, fastThreshold=12)
+        dets[key] = det
+    return det
+
+
+# Below this many screenshot descriptors brute force beats building an LSH index
+_FLANN_MIN_TRAIN = 200
+_LSH_INDEX = dict(algorithm=6, table_number=6, key_size=12, multi_probe_level=1)  # FLANN_INDEX_LSH
+
+
+def _flann():
+    flann = getattr(_tls, "flann", None)
+    if flann is None:
+        flann = _tls.flann = cv2.FlannBasedMatcher(_LSH_INDEX, dict(checks=50))
+    return flann
+
+
+def _knn2(des1: np.ndarray, des2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Two nearest screenshot descriptors (Hamming) for every template descriptor, as
+    (N, 2) distance and index arrays. Large sets go through FLANN LSH (sub-linear);
+    queries LSH finds fewer than two neighbours for get zero distances, which fail
+    the ratio test.
+    """
+    if len(des2) < _FLANN_MIN_TRAIN:
+        return cv2.batchDistance(des1, des2, cv2.CV_32S, normType=cv2.NORM_HAMMING, K=2)
+    dist = np.zeros((len(des1), 2), dtype=np.float32)
+    nidx = np.zeros((len(des1), 2), dtype=np.int32)
+    for q, pair in enumerate(_flann().knnMatch(des1, des2, k=2)):
+        if len(pair) == 2:
+            m, n = pair
+            dist[q] = (m.distance, n.distance)
+            nidx[q] = (m.trainIdx, n.trainIdx)
+    return dist, nidx
+
+
+def extract_template_features(tmpl: np.ndarray, method: str = "ORB") -> TemplateFeatures:
+    """Detect and describe a grayscale template once so it can be matched repeatedly."""
+    method = method.upper()
+    # Large templates carry enough structure at half resolution; extract features
+    # there (the screenshot is reduced the same way) and map keypoints back up
+    scale = 1.0
+    src = tmpl
+    if max(tmpl.shape[:2]) > _DOWNSAMPLE_ABOVE_PX:
+        scale = 2.0
+        src = cv2.pyrDown(tmpl)
+    kp, des = _detector(method, _orb_budget(src.shape, 64, 200, 2000)).detectAndCompute(src, None)
+    h, w = tmpl.shape[:2]
+    corners = np.float64([[0, 0, 1], [w, 0, 1], [w, h, 1], [0, h, 1]])
+    return TemplateFeatures(des, _keypoint_coords(kp) * scale, (h, w), corners, scale, method)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_template_features(path: str, mtime: float, method: str) -> Optional[TemplateFeatures]:
+    tmpl = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if tmpl is None:
+        return None
+    return extract_template_features(tmpl, method)
+
+
+def load_template_features(template_path: Path, method: str = "ORB") -> Optional[TemplateFeatures]:
+    """
+    Template features cached by (path, mtime, method); re-captured templates are
+    picked up automatically. Returns None if the template cannot be read.
+    """
+    try:
+        mtime = template_path.stat().st_mtime
+    except OSError:
+        return None
+    return _cached_template_features(str(template_path), mtime, method.upper())
+
+
 def _cluster_points(points: np.ndarray, bin_size: float = 40.0, min_cluster: int = 6) -> List[np.ndarray]:
     """
     Simple grid-based clustering of 2D points. Returns list of index arrays.
     """
-    xs = points[:, 0]
-    ys = points[:, 1]
-    gx = np.floor(xs / bin_size).astype(int)
-    gy = np.floor(ys / bin_size).astype(int)
-    buckets: dict[tuple[int, int], List[int]] = {}
-    for i, (bx, by) in enumerate(zip(gx, gy)):
-        buckets.setdefault((bx, by), []).append(i)
-    clusters = [np.array(idx_list, dtype=int) for idx_list in buckets.values() if len(idx_list) >= min_cluster]
-    return clusters
+    if len(points) == 0:
+        return []
+    gx = np.floor(points[:, 0] / bin_size).astype(np.int64)
+    gy = np.floor(points[:, 1] / bin_size).astype(np.int64)
+    # One int64 key per grid cell; a stable sort keeps each cell's indices ascending
+    keys = (gx << 32) | (gy & 0xFFFFFFFF)
+    order = np.argsort(keys, kind="stable")
+    _, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+    return [order[s : s + c] for s, c in zip(starts, counts) if c >= min_cluster]
+
+
+_HOMOGRAPHY_SAMPLE = 80
+_REPROJ_THRESHOLD = 3.0
+_MIN_INLIERS = 4  # the 4-point minimum a homography needs
+# Sets this small are fitted with a reduced iteration budget; they still have to
+# clear min_score, and the projected box must pass _plausible_quads
+_SMALL_SET = 16
+_SMALL_SET_ITERS = 200
+_MAX_ITERS = 2000
+
+
+def _fit_homography(pts_tmpl: np.ndarray, pts_img: np.ndarray, min_score: float) -> Tuple[np.ndarray, float] | None:
+    """
+    Fit template->screen homography with MAGSAC++; returns (H, inlier ratio).
+    Points must be ordered strongest match first; large sets are fitted on the
+    strongest _HOMOGRAPHY_SAMPLE only (far above the 4-point minimum), while the
+    score is still the inlier ratio over every match. Returns None when the fit
+    is below min_score or _MIN_INLIERS.
+    """
+    src, dst = pts_tmpl[:_HOMOGRAPHY_SAMPLE], pts_img[:_HOMOGRAPHY_SAMPLE]
+    max_iters = _SMALL_SET_ITERS if len(src) <= _SMALL_SET else _MAX_ITERS
+    H, _ = cv2.findHomography(src, dst, cv2.USAC_MAGSAC, _REPROJ_THRESHOLD, maxIters=max_iters, confidence=0.99)
+    if H is None:
+        return None
+    reproj = cv2.perspectiveTransform(pts_tmpl.reshape(-1, 1, 2), H).reshape(-1, 2)
+    d = reproj - pts_img
+    err2 = np.einsum("ij,ij->i", d, d)  # squared error; no sqrt needed to threshold
+    inliers = int(np.count_nonzero(err2 <= _REPROJ_THRESHOLD * _REPROJ_THRESHOLD))
+    score = inliers / max(1, len(pts_tmpl))
+    if inliers < _MIN_INLIERS or score < min_score:
+        return None
+    return H, score
+
+
+# Projected template area relative to the template's own; outside this the fit is degenerate
+_MIN_AREA_RATIO = 1 / 16
+_MAX_AREA_RATIO = 16.0
+# Longest/shortest ratio allowed between opposite edges (screen content is seen head-on)
+_MAX_EDGE_SKEW = 2.0
+# Share of the projected box that must lie inside the frame
+_MIN_ON_FRAME = 0.5
+
+
+def _project_quads(Hs: np.ndarray, corners: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Project the template corners through a stack of homographies (n, 3, 3) in
+    one einsum. Returns the (n, 4, 2) corner coordinates and the (n, 4)
+    homogeneous scale of each corner (<= 0 means it landed behind the camera).
+    """
+    proj = np.einsum("nij,kj->nki", Hs, corners)
+    w = proj[..., 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xy = proj[..., :2] / proj[..., 2:3]
+    return xy, w
+
+
+def _plausible_quads(xy: np.ndarray, w: np.ndarray, tmpl_shape: Tuple[int, int], frame_shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    Mask of projected quads that can be a real on-screen template: all corners
+    in front, a strictly convex outline with the template's (unmirrored)
+    orientation, opposite edges within _MAX_EDGE_SKEW of each other, an area
+    within _MIN/_MAX_AREA_RATIO of the template's, and at least _MIN_ON_FRAME
+    of the enclosing box on the frame.
+    """
+    ok = np.all(w > 0, axis=1) & np.all(np.isfinite(xy), axis=(1, 2))
+    xy = np.where(ok[:, None, None], xy, 0.0)
+    # Cross product of consecutive edges; the template's own corners (clockwise
+    # in y-down image space) give positive values, so any other sign is a fold or mirror
+    e = np.roll(xy, -1, axis=1) - xy
+    e_next = np.roll(e, -1, axis=1)
+    ok &= np.all(e[:, :, 0] * e_next[:, :, 1] - e[:, :, 1] * e_next[:, :, 0] > 0, axis=1)
+    # Opposite edges: top/bottom and right/left
+    length = np.hypot(e[:, :, 0], e[:, :, 1])
+    for a, b in ((0, 2), (1, 3)):
+        lo_len = np.minimum(length[:, a], length[:, b])
+        ok &= np.maximum(length[:, a], length[:, b]) <= _MAX_EDGE_SKEW * lo_len
+    # Shoelace area against the template's
+    area = 0.5 * np.abs(np.sum(xy[:, :, 0] * np.roll(xy[:, :, 1], -1, axis=1) - np.roll(xy[:, :, 0], -1, axis=1) * xy[:, :, 1], axis=1))
+    ratio = area / float(tmpl_shape[0] * tmpl_shape[1])
+    ok &= (ratio >= _MIN_AREA_RATIO) & (ratio <= _MAX_AREA_RATIO)
+    # Enclosing box overlap with the frame
+    fh, fw = frame_shape[:2]
+    lo, hi = xy.min(axis=1), xy.max(axis=1)
+    box_area = np.prod(np.maximum(hi - lo, 1e-6), axis=1)
+    inside = np.prod(np.clip(np.minimum(hi, (fw, fh)) - np.maximum(lo, 0), 0, None), axis=1)
+    ok &= inside >= _MIN_ON_FRAME * box_area
+    return ok
+
+
+def _quad_boxes(xy: np.ndarray) -> np.ndarray:
+    """Enclosing (x, y, w, h) boxes of projected quads as an (n, 4) int32 array."""
+    lo = xy.min(axis=1).astype(np.int32)
+    hi = xy.max(axis=1).astype(np.int32)
+    return np.concatenate([lo, np.maximum(1, hi - lo)], axis=1)
+
+
+def _plausible_fits(fits: list, features: TemplateFeatures, frame_shape: Tuple[int, ...]) -> Tuple[list, np.ndarray]:
+    """Drop fits whose projected template is degenerate; returns the kept fits and their quads."""
+    if not fits:
+        return [], np.empty((0, 4, 2))
+    xy, w = _project_quads(np.stack([H for H, _ in fits]), features.corners)
+    ok = _plausible_quads(xy, w, features.shape, frame_shape)
+    return [f for f, keep in zip(fits, ok) if keep], xy[ok]
 
 
 def feature_match(
@@ -48,90 +266,80 @@ def feature_match(
     max_candidates: int = 5,
 ) -> FeatureMatchResult:
     """
-    Feature-based matching using ORB/AKAZE + BFMatcher + RANSAC homography.
+    Feature-based matching using ORB/AKAZE + Hamming kNN ratio test + RANSAC homography.
     Produces multiple candidates via simple clustering and non-maximum suppression.
     """
-    img_color = cv2.imread(str(screenshot_path), cv2.IMREAD_COLOR)
-    tmpl_color = cv2.imread(str(template_path), cv2.IMREAD_COLOR)
-    if img_color is None or tmpl_color is None:
+    img = cv2.imread(str(screenshot_path), cv2.IMREAD_GRAYSCALE)
+    features = load_template_features(template_path, method)
+    if img is None or features is None:
         return FeatureMatchResult([])
 
-    img = cv2.cvtColor(img_color, cv2.COLOR_BGR2GRAY)
-    tmpl = cv2.cvtColor(tmpl_color, cv2.COLOR_BGR2GRAY)
-
-    if method.upper() == "AKAZE":
-        det = cv2.AKAZE_create()
-    else:
-        det = cv2.ORB_create(nfeatures=2000)
-
-    kp1, des1 = det.detectAndCompute(tmpl, None)
-    kp2, des2 = det.detectAndCompute(img, None)
-    if des1 is None or des2 is None or len(kp1) < 4 or len(kp2) < 4:
-        return FeatureMatchResult([])
+    return feature_match_array(img, features, confidence_threshold=confidence_threshold, method=method, max_candidates=max_candidates)
 
-    # Use Hamming distance for ORB/AKAZE
-    bf = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=False)
-    matches = bf.knnMatch(des1, des2, k=2)
 
-    good: list[cv2.DMatch] = []
-    for pair in matches:
-        if len(pair) != 2:
-            continue
-        m, n = pair
-        if m.distance < 0.75 * n.distance:
-            good.append(m)
+def feature_match_array(
+    img: np.ndarray,
+    tmpl: np.ndarray | TemplateFeatures,
+    confidence_threshold: float = 0.5,
+    method: str = "ORB",
+    max_candidates: int = 5,
+) -> FeatureMatchResult:
+    """
+    Same as feature_match but on an already-decoded grayscale screenshot,
+    e.g. a frame grabbed straight from mss. The template may be a grayscale
+    image or precomputed TemplateFeatures (which then decide the method).
+    """
+    features = tmpl if isinstance(tmpl, TemplateFeatures) else extract_template_features(tmpl, method)
+    up = features.scale
+    img_src = cv2.pyrDown(img) if up != 1.0 else img
+    det = _detector(features.method, _orb_budget(img_src.shape, 256, 1000, 4000))
 
-    if len(good) < 4:
+    des1 = features.descriptors
+    kp2, des2 = det.detectAndCompute(img_src, None)
+    if des1 is None or des2 is None or len(features.points) < 4 or len(kp2) < 4:
         return FeatureMatchResult([])
 
-    pts_tmpl = np.float32([kp1[m.queryIdx].pt for m in good])
-    pts_img = np.float32([kp2[m.trainIdx].pt for m in good])
+    # Two nearest neighbours per template descriptor (Hamming for ORB/AKAZE),
+    # then Lowe's ratio test as a mask instead of a loop over DMatch pairs
+    dist, nidx = _knn2(des1, des2)
+    good = dist[:, 0] < 0.75 * dist[:, 1]
+    if np.count_nonzero(good) < _MIN_INLIERS:
+        return FeatureMatchResult([])
 
-    # Cluster by proximity in image space
-    clusters = _cluster_points(pts_img, bin_size=40.0, min_cluster=6)
-    candidates: List[Candidate] = []
-
-    h, w = tmpl.shape[:2]
-    tmpl_corners = np.float32([[0, 0], [w, 0], [w, h], [0, h]]).reshape(-1, 1, 2)
+    # Strongest (lowest-distance) matches first; clusters keep this order, so the
+    # homography fit can take a prefix instead of sampling. Both sets are
+    # contiguous float32 (N, 2), which findHomography takes without converting
+    order = np.flatnonzero(good)[np.argsort(dist[good, 0], kind="stable")]
+    pts_tmpl = features.points[order]
+    pts_img = np.ascontiguousarray(_keypoint_coords(kp2)[nidx[order, 0]] * up, dtype=np.float32)
 
+    # Cluster by proximity in image space; with too few matches for two clusters
+    # go straight to the global homography below
+    min_cluster = 6
+    clusters = _cluster_points(pts_img, bin_size=40.0, min_cluster=min_cluster) if len(pts_img) >= 2 * min_cluster else []
+    fits = []
     for idxs in clusters:
-        src = pts_tmpl[idxs].reshape(-1, 1, 2)
-        dst = pts_img[idxs].reshape(-1, 1, 2)
-        if src.shape[0] < 4 or dst.shape[0] < 4:
-            continue
-        H, mask = cv2.findHomography(src, dst, cv2.RANSAC, 5.0)
-        if H is None:
-            continue
-        inliers = int(mask.sum()) if mask is not None else 0
-        score = inliers / max(1, src.shape[0])
-        projected = cv2.perspectiveTransform(tmpl_corners, H)
-        xs = projected[:, 0, 0]
-        ys = projected[:, 0, 1]
-        x_min, y_min, x_max, y_max = int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max())
-        bbox = (x_min, y_min, max(1, x_max - x_min), max(1, y_max - y_min))
-        if score >= confidence_threshold:
-            candidates.append(Candidate(bbox=bbox, score=score))
+        fit = _fit_homography(pts_tmpl[idxs], pts_img[idxs], confidence_threshold)
+        if fit is not None:
+            fits.append(fit)
+
+    # All template quads in one batched projection; degenerate fits are dropped
+    fits, quads = _plausible_fits(fits, features, img.shape)
 
     # Fallback: compute global homography if no clusters yielded candidates
-    if not candidates:
-        src = pts_tmpl.reshape(-1, 1, 2)
-        dst = pts_img.reshape(-1, 1, 2)
-        H, mask = cv2.findHomography(src, dst, cv2.RANSAC, 5.0)
-        if H is not None:
-            inliers = int(mask.sum()) if mask is not None else 0
-            score = inliers / max(1, src.shape[0])
-            projected = cv2.perspectiveTransform(tmpl_corners, H)
-            xs = projected[:, 0, 0]
-            ys = projected[:, 0, 1]
-            x_min, y_min, x_max, y_max = int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max())
-            bbox = (x_min, y_min, max(1, x_max - x_min), max(1, y_max - y_min))
-            candidates.append(Candidate(bbox=bbox, score=score))
-
-    # Non-maximum suppression on candidate boxes
-    boxes = np.array([c.bbox for c in candidates], dtype=np.int32)
-    scores = np.array([c.score for c in candidates], dtype=np.float32)
+    if not fits:
+        fit = _fit_homography(pts_tmpl, pts_img, confidence_threshold)
+        if fit is None:
+            return FeatureMatchResult([])
+        fits, quads = _plausible_fits([fit], features, img.shape)
+        if not fits:
+            return FeatureMatchResult([])
+
+    # Enclosing boxes, then non-maximum suppression
+    boxes = _quad_boxes(quads)
+    scores = np.array([score for _, score in fits], dtype=np.float32)
     keep_idx = non_max_suppression(boxes, scores, iou_threshold=0.3)
-    candidates = [candidates[i] for i in keep_idx]
+    candidates = [Candidate(bbox=tuple(boxes[i].tolist()), score=fits[i][1]) for i in keep_idx]
 
     candidates.sort(key=lambda c: c.score, reverse=True)
     return FeatureMatchResult(candidates=candidates[:max_candidates])
\ No newline at end of file
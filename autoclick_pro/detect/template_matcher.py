@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
 
 
+# Run matchTemplate through the transparent API (OpenCL) when a device is present
+_USE_OPENCL = cv2.ocl.haveOpenCL()
+if _USE_OPENCL:
+    cv2.ocl.setUseOpenCL(True)
+
+# Per-scale workers for match_template_array (threads are spawned on first use);
+# on a single core the scales simply run in sequence
+_SCALE_WORKERS = min(4, os.cpu_count() or 1)
+_SCALE_POOL = ThreadPoolExecutor(max_workers=_SCALE_WORKERS, thread_name_prefix="tm-scale")
+
+
 @dataclass
 class MatchResult:
     found: bool
@@ -21,41 +34,167 @@ def match_template(
     confidence_threshold: float = 0.85,
     roi: Optional[Tuple[int, int, int, int]] = None,
     method: int = cv2.TM_CCOEFF_NORMED,
+    grayscale: bool = False,
 ) -> MatchResult:
     """
     Basic template matcher using OpenCV normalized correlation.
-    Supports optional ROI (x, y, w, h).
+    Supports optional ROI (x, y, w, h). With grayscale=True both images are
+    decoded straight to one channel, a third of the data to correlate, for
+    templates whose colour does not matter.
     """
-    img = cv2.imread(str(screenshot_path), cv2.IMREAD_COLOR)
-    tmpl = cv2.imread(str(template_path), cv2.IMREAD_COLOR)
+    flags = cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
+    img = cv2.imread(str(screenshot_path), flags)
+    tmpl = cv2.imread(str(template_path), flags)
     if img is None or tmpl is None:
         return MatchResult(False, None, 0.0)
+    return match_template_array(img, tmpl, confidence_threshold=confidence_threshold, roi=roi, method=method)
+
 
+def match_template_array(
+    img: np.ndarray,
+    tmpl: np.ndarray,
+    confidence_threshold: float = 0.85,
+    roi: Optional[Tuple[int, int, int, int]] = None,
+    method: int = cv2.TM_CCOEFF_NORMED,
+) -> MatchResult:
+    """
+    Same as match_template but on already-decoded images (BGR or grayscale,
+    both with the same channel count), e.g. a frame grabbed straight from mss.
+    """
     if roi is not None:
         x, y, w, h = roi
         x = max(0, x)
         y = max(0, y)
         w = max(1, w)
         h = max(1, h)
-        img = img[y : y + h, x : x + w].copy()
+        img = img[y : y + h, x : x + w]
 
-    # Multi-scale search (coarse; small pyramid)
-    scales = [1.0, 0.9, 0.8, 1.1]
-    best_score = -1.0
-    best_bbox = None
-
-    for s in scales:
+    # Multi-scale search (coarse; small pyramid). With an OpenCL device the frame
+    # is uploaded once and every scale correlates against it in full; on the CPU
+    # each scale runs coarse-to-fine against one shared half-resolution frame.
+    # Scales are independent and matchTemplate releases the GIL, so they run on
+    # a small shared pool
+    sizes = []
+    for s in (1.0, 0.9, 0.8, 1.1):
         new_w = max(1, int(tmpl.shape[1] * s))
         new_h = max(1, int(tmpl.shape[0] * s))
-        resized = cv2.resize(tmpl, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        res = cv2.matchTemplate(img, resized, method)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(res)
-        score = max_val
-        if score > best_score:
-            best_score = score
-            top_left = max_loc
-            h, w = resized.shape[:2]
-            best_bbox = (top_left[0], top_left[1], w, h)
+        if new_w <= img.shape[1] and new_h <= img.shape[0]:
+            sizes.append((new_w, new_h))
+    if not sizes:
+        return MatchResult(False, None, -1.0)
+
+    src = cv2.UMat(img) if _USE_OPENCL else img
+    coarse = not _USE_OPENCL and method in _MAX_IS_BEST
+    small = cv2.pyrDown(img) if coarse and max(min(wh) for wh in sizes) >= _COARSE_MIN_SIDE else None
+
+    def one_scale(size: Tuple[int, int]) -> Tuple[float, Tuple[int, int, int, int]]:
+        # Scales stay within ±20%, where INTER_LINEAR matches INTER_AREA for
+        # correlation at a fraction of the cost; 1.0 needs no resample at all
+        if size == (tmpl.shape[1], tmpl.shape[0]):
+            resized = tmpl
+        else:
+            resized = cv2.resize(tmpl, size, interpolation=cv2.INTER_LINEAR)
+        if resized.shape == img.shape and method == cv2.TM_CCOEFF_NORMED:
+            # Template covers the whole (ROI) image: a single correlation score
+            score, top_left = _ccoeff_normed_same_size(img, resized), (0, 0)
+        elif small is not None and min(size) >= _COARSE_MIN_SIDE:
+            score, top_left = _match_coarse_to_fine(img, small, resized, method, _COARSE_RATIO * confidence_threshold)
+        else:
+            res = cv2.matchTemplate(src, resized, method)
+            min_val, score, min_loc, top_left = cv2.minMaxLoc(res)
+        return score, (top_left[0], top_left[1], size[0], size[1])
+
+    if _SCALE_WORKERS > 1 and len(sizes) > 1:
+        results = list(_SCALE_POOL.map(one_scale, sizes))
+    else:
+        results = [one_scale(size) for size in sizes]
+    # First-listed scale wins ties, as in a sequential scan
+    best_score, best_bbox = max(results, key=lambda r: r[0])
 
     found = best_score >= confidence_threshold
-    return MatchResult(found, best_bbox, float(best_score))
\ No newline at end of file
+    return MatchResult(found, best_bbox, float(best_score))
+
+
+def _ccoeff_normed_same_size(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    TM_CCOEFF_NORMED of two equal-size images without building a result map.
+    Built from cv2.mean/cv2.norm (SIMD reductions in C): sum(a*b) follows from
+    |a|^2 + |b|^2 - |a-b|^2, and per-channel means are subtracted analytically.
+    """
+    n = a.shape[0] * a.shape[1]
+    ch = a.shape[2] if a.ndim == 3 else 1
+    ma = np.array(cv2.mean(a)[:ch])
+    mb = np.array(cv2.mean(b)[:ch])
+    saa = cv2.norm(a, cv2.NORM_L2SQR)
+    sbb = cv2.norm(b, cv2.NORM_L2SQR)
+    sab = (saa + sbb - cv2.norm(a, b, cv2.NORM_L2SQR)) / 2.0
+    num = sab - n * float(ma @ mb)
+    den = np.sqrt(max(0.0, saa - n * float(ma @ ma)) * max(0.0, sbb - n * float(mb @ mb)))
+    return float(num / den) if den > 0 else 0.0
+
+
+# Coarse-to-fine needs scores where higher is better and a template that still
+# carries detail at half resolution
+_MAX_IS_BEST = (cv2.TM_CCOEFF_NORMED, cv2.TM_CCORR_NORMED)
+_COARSE_MIN_SIDE = 32
+_COARSE_RATIO = 0.6  # half-res peaks above this fraction of the threshold become ROIs
+_MAX_ROIS = 8
+
+
+def _match_coarse_to_fine(
+    img: np.ndarray, small: np.ndarray, tmpl: np.ndarray, method: int, coarse_threshold: float
+) -> Tuple[float, Tuple[int, int]]:
+    """
+    Match at half resolution, merge the promising peaks into ROIs (square-kernel
+    dilation + connected components) and rerun full-resolution matchTemplate only
+    inside them. Returns (best score, top-left in img); the score is always a
+    full-resolution one, so it compares directly with the threshold.
+    """
+    res = cv2.matchTemplate(small, cv2.pyrDown(tmpl), method)
+    _, coarse_max, _, (cx, cy) = cv2.minMaxLoc(res)
+    if coarse_max < coarse_threshold:
+        # Nothing worth refining; still score the half-res peak at full resolution
+        rois = np.array([[cx, cy, 1, 1]])
+    else:
+        mask = cv2.dilate((res >= coarse_threshold).astype(np.uint8), np.ones((3, 3), np.uint8))
+        _, _, stats, _ = cv2.connectedComponentsWithStats(mask)
+        rois = stats[1:, :4]
+        if len(rois) > _MAX_ROIS:
+            # Busy screen (many near-matches): refine only the strongest half-res peaks
+            peaks = [res[y : y + h, x : x + w].max() for x, y, w, h in rois]
+            rois = rois[np.argsort(peaks)[::-1][:_MAX_ROIS]]
+
+    th, tw = tmpl.shape[:2]
+    best_score, best_loc = -1.0, None
+    for x, y, w, h in rois.tolist():
+        x0 = max(0, 2 * x - 2)
+        y0 = max(0, 2 * y - 2)
+        x1 = min(img.shape[1], 2 * (x + w) + tw + 2)
+        y1 = min(img.shape[0], 2 * (y + h) + th + 2)
+        if x1 - x0 < tw or y1 - y0 < th:
+            continue
+        _, score, _, (mx, my) = cv2.minMaxLoc(cv2.matchTemplate(img[y0:y1, x0:x1], tmpl, method))
+        if best_loc is None or score > best_score:
+            best_score, best_loc = score, (x0 + mx, y0 + my)
+    if best_loc is None:
+        # Every window was clipped too small to refine: fall back to one full-resolution pass
+        _, best_score, _, best_loc = cv2.minMaxLoc(cv2.matchTemplate(img, tmpl, method))
+    return best_score, best_loc
+
+
+def match_template_batch(
+    img: np.ndarray,
+    templates: Sequence[np.ndarray],
+    confidence_threshold: float = 0.85,
+    executor: Optional[Executor] = None,
+) -> List[MatchResult]:
+    """
+    Match several templates against one frame. With an executor the matches run
+    concurrently; cv2.matchTemplate releases the GIL, so distinct templates scale
+    across cores. Results are returned in template order.
+    """
+    if executor is None or len(templates) < 2:
+        return [match_template_array(img, t, confidence_threshold=confidence_threshold) for t in templates]
+    futures = [executor.submit(match_template_array, img, t, confidence_threshold) for t in templates]
+    return [f.result() for f in futures]
+
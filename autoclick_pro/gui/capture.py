@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QPoint, QRect
+from PySide6.QtCore import Qt, QPoint, QRect, QTimer
 from PySide6.QtGui import QPixmap, QPainter, QColor
 from PySide6.QtWidgets import QDialog, QLabel, QVBoxLayout, QPushButton
 
@@ -28,6 +28,12 @@ class CaptureDialog(QDialog):
         self._start: Optional[QPoint] = None
         self._end: Optional[QPoint] = None
 
+        # Coalesce drag repaints to ~60 fps; mouse moves can arrive far faster
+        self._pending_timer = QTimer(self)
+        self._pending_timer.setSingleShot(True)
+        self._pending_timer.setInterval(16)
+        self._pending_timer.timeout.connect(self._update_overlay)
+
         v = QVBoxLayout(self)
         self.label = QLabel()
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -37,7 +43,7 @@ class CaptureDialog(QDialog):
         v.addWidget(self.btn_save)
         self.btn_save.clicked.connect(self._save_selection)
 
-        # Load current screen
+        # Load current screen; decoded once, overlays draw on copies of it
         self.screen_path = grab_screen()
         self.pixmap = QPixmap(str(self.screen_path))
         self.label.setPixmap(self.pixmap)
@@ -50,15 +56,17 @@ class CaptureDialog(QDialog):
     def mouseMoveEvent(self, event) -> None:
         if self._start is not None:
             self._end = event.position().toPoint()
-            self._update_overlay()
+            if not self._pending_timer.isActive():
+                self._pending_timer.start()
 
     def mouseReleaseEvent(self, event) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
             self._end = event.position().toPoint()
+            self._pending_timer.stop()
             self._update_overlay()
 
     def _update_overlay(self) -> None:
-        pm = QPixmap(str(self.screen_path))
+        pm = self.pixmap.copy()
         if self._start and self._end:
             rect = QRect(self._start, self._end).normalized()
             painter = QPainter(pm)
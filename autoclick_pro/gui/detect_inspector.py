@@ -3,15 +3,16 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional, Tuple, List
 
+import numpy as np
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import QDialog, QLabel, QVBoxLayout, QPushButton, QHBoxLayout
 
-from autoclick_pro.util.overlay import annotate_detection, annotate_candidates
+from autoclick_pro.util.overlay import annotate_detection, annotate_candidates, draw_candidates, draw_detection
 
 
 class DetectInspector(QDialog):
-    def __init__(self, parent=None, screenshot_path: Path | None = None, bbox: Tuple[int, int, int, int] | None = None, score: float = 0.0, candidates: List[Tuple[Tuple[int, int, int, int], float]] | None = None):
+    def __init__(self, parent=None, screenshot_path: Path | None = None, bbox: Tuple[int, int, int, int] | None = None, score: float = 0.0, candidates: List[Tuple[Tuple[int, int, int, int], float]] | None = None, screenshot: Optional[np.ndarray] = None):
         super().__init__(parent)
         self.setWindowTitle("Detection Inspector")
         self.resize(800, 600)
@@ -29,8 +30,19 @@ class DetectInspector(QDialog):
 
         self.btn_close.clicked.connect(self.accept)
 
-        # Render annotated image
-        if screenshot_path is not None:
+        # Render annotated image; an in-memory BGR screenshot is annotated on a
+        # copy so the caller's frame is left untouched
+        if screenshot is not None:
+            screenshot = screenshot.copy()
+            if candidates:
+                draw_candidates(screenshot, candidates)
+            else:
+                draw_detection(screenshot, bbox, score)
+            h, w = screenshot.shape[:2]
+            qimg = QImage(screenshot.data, w, h, screenshot.strides[0], QImage.Format.Format_BGR888)
+            # copy() detaches from the numpy buffer before it can be freed
+            self.image_label.setPixmap(QPixmap.fromImage(qimg.copy()))
+        elif screenshot_path is not None:
             if candidates:
                 annotated = annotate_candidates(screenshot_path, candidates)
             else:
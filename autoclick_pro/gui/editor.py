@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Deque, List, Optional
+import json
 import threading
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractListModel, QEvent, QModelIndex, QObject, QPersistentModelIndex, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import QPainter, QPalette, QStaticText
 from PySide6.QtWidgets import (
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QWidget,
     QVBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QHBoxLayout,
     QPushButton,
     QFormLayout,
@@ -16,10 +23,201 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QComboBox,
     QLabel,
+    QMessageBox,
 )
 
 from autoclick_pro.data.model import Action
 
+# Imported up front so the first pick does not pay for it while the window is
+# hidden; pynput can fail at import time without a usable input backend
+try:
+    from pynput import mouse as _pynput_mouse
+except Exception:
+    _pynput_mouse = None
+
+
+@dataclass(slots=True)
+class EditOp:
+    """
+    One undoable timeline edit and just enough state to invert it:
+    insert/remove carry the Action, extend carries the appended Actions, edit
+    carries field dicts, move carries the row before and after.
+    """
+    kind: str  # "insert" | "remove" | "extend" | "edit" | "move"
+    index: int
+    before: Any = None
+    after: Any = None
+
+
+_UNDO_LIMIT = 50  # oldest operations are evicted first
+
+
+def _editable_fields(a: Action) -> dict[str, Any]:
+    return {f.name: getattr(a, f.name) for f in fields(Action) if f.init}
+
+
+class ActionListModel(QAbstractListModel):
+    """
+    List model over the editor's actions; the row list is the single source of
+    truth, so the view only creates and paints what is visible. Rows show the
+    formatter's label and carry the Action itself under UserRole.
+    """
+    def __init__(self, formatter: Callable[[Action], str], parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._format = formatter
+        self._rows: List[Action] = []
+        # Actions grouped by type in row order, rebuilt lazily after any change
+        self._by_type: Optional[dict[str, List[Action]]] = None
+        for sig in (self.rowsInserted, self.rowsRemoved, self.rowsMoved, self.modelReset, self.dataChanged):
+            sig.connect(self._invalidate_types)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._format(self._rows[index.row()])
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()]
+        return None
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            # Dropping between rows lands on the root
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+
+    def supportedDropActions(self) -> Qt.DropAction:
+        return Qt.DropAction.MoveAction
+
+    def moveRows(
+        self,
+        source_parent: QModelIndex | QPersistentModelIndex,
+        source_row: int,
+        count: int,
+        dest_parent: QModelIndex | QPersistentModelIndex,
+        dest_child: int,
+    ) -> bool:
+        # QListView's internal-move drop calls this one row at a time
+        if source_parent.isValid() or dest_parent.isValid() or count < 1:
+            return False
+        if source_row <= dest_child <= source_row + count:
+            return False
+        if not self.beginMoveRows(QModelIndex(), source_row, source_row + count - 1, QModelIndex(), dest_child):
+            return False
+        moved = self._rows[source_row : source_row + count]
+        del self._rows[source_row : source_row + count]
+        at = dest_child - count if dest_child > source_row else dest_child
+        self._rows[at:at] = moved
+        self.endMoveRows()
+        return True
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() or row < 0 or count < 1 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self._rows[row : row + count]
+        self.endRemoveRows()
+        return True
+
+    def actions(self) -> List[Action]:
+        return list(self._rows)
+
+    def action(self, row: int) -> Action:
+        return self._rows[row]
+
+    def actions_of_type(self, type_: str) -> List[Action]:
+        if self._by_type is None:
+            by_type: dict[str, List[Action]] = {}
+            for a in self._rows:
+                by_type.setdefault(a.type, []).append(a)
+            self._by_type = by_type
+        return self._by_type.get(type_, [])
+
+    def _invalidate_types(self, *_) -> None:
+        self._by_type = None
+
+    def set_actions(self, actions: List[Action]) -> None:
+        self.beginResetModel()
+        self._rows = list(actions)
+        self.endResetModel()
+
+    def insert_action(self, row: int, a: Action) -> None:
+        self.insert_actions(row, [a])
+
+    def insert_actions(self, row: int, actions: List[Action]) -> None:
+        """Insert a run of actions with a single rowsInserted notification."""
+        self.beginInsertRows(QModelIndex(), row, row + len(actions) - 1)
+        self._rows[row:row] = actions
+        self.endInsertRows()
+
+    def action_changed(self, row: int) -> None:
+        """Re-render a row whose Action was mutated in place."""
+        a = self._rows[row]
+        a._display_cache = None
+        a._params_json = None
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx)
+
+
+class TimelineDelegate(QStyledItemDelegate):
+    """
+    Paints timeline rows from cached QStaticText (laid out once per distinct
+    label, then blitted) and answers sizeHint from one cached size; with
+    uniform item sizes every row is as tall as the first. Both caches are
+    dropped when the parent view's font or style changes.
+    """
+    _MAX_CACHED = 4096
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._static: dict[str, QStaticText] = {}
+        self._size: Optional[QSize] = None
+        if parent is not None:
+            parent.installEventFilter(self)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is not self.parent():
+            return super().eventFilter(watched, event)  # editor focus/key handling
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+            # Runs before the view relays out, so it picks up the new size
+            self._static.clear()
+            self._size = None
+        return False
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> None:
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = opt.text
+        # Background, selection and focus from the style; the text is ours
+        opt.text = ""
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        st = self._static.get(text)
+        if st is None:
+            if len(self._static) >= self._MAX_CACHED:
+                self._static.clear()
+            st = self._static[text] = QStaticText(text)
+            st.setTextFormat(Qt.TextFormat.PlainText)
+            st.prepare(painter.transform(), opt.font)
+        rect = style.subElementRect(QStyle.SubElement.SE_ItemViewItemText, opt, widget)
+        role = QPalette.ColorRole.HighlightedText if opt.state & QStyle.StateFlag.State_Selected else QPalette.ColorRole.Text
+        painter.save()
+        painter.setClipRect(rect)
+        painter.setFont(opt.font)
+        painter.setPen(opt.palette.color(role))
+        painter.drawStaticText(rect.left(), rect.top() + (rect.height() - st.size().height()) / 2, st)
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QSize:
+        if self._size is None:
+            self._size = super().sizeHint(option, index)
+        return self._size
+
 
 class MacroEditor(QWidget):
     """
@@ -34,12 +232,26 @@ class MacroEditor(QWidget):
         root = QHBoxLayout(self)
 
         # Timeline list
-        self.timeline = QListWidget()
-        self.timeline.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        self.timeline.setDragDropMode(QListWidget.DragDropMode.InternalMove)
+        self.model = ActionListModel(self._format_action, self)
+        self.timeline = QListView()
+        self.timeline.setModel(self.model)
+        self.timeline.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.timeline.setDragDropMode(QListView.DragDropMode.InternalMove)
         self.timeline.setAlternatingRowColors(True)
         self.timeline.setUniformItemSizes(True)
-        self.timeline.currentItemChanged.connect(self._on_selection_changed)
+        # Lay out long timelines in chunks between events instead of in one pass
+        self.timeline.setLayoutMode(QListView.LayoutMode.Batched)
+        self.timeline.setBatchSize(256)
+        self.timeline.setItemDelegate(TimelineDelegate(self.timeline))
+        self.timeline.selectionModel().currentChanged.connect(self._on_selection_changed)
+        # actions_changed is coalesced to once per event-loop pass, so bursts of
+        # edits (drag-reorder, repeated undo) re-render the flow views once
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(0)
+        self._changed_timer.timeout.connect(self.actions_changed)
+        # Drag-reordering changes the flow just like an edit does
+        self.model.rowsMoved.connect(self._notify_changed)
 
         # Right properties panel
         props = QWidget()
@@ -48,7 +260,7 @@ class MacroEditor(QWidget):
 
         self.input_id = QLineEdit()
         self.input_type = QComboBox()
-        self.input_type.addItems(["wait", "mouse_click", "key_sequence", "detect", "conditional_jump", "label", "loop_until"])
+        self.input_type.addItems(["wait", "mouse_click", "key_sequence", "detect", "detect_any", "conditional_jump", "label", "loop_until"])
         self.input_target = QLineEdit()
         self.input_params = QLineEdit()
         self.input_delay_before = QSpinBox()
@@ -98,8 +310,10 @@ class MacroEditor(QWidget):
         root.addLayout(v, 2)
         root.addWidget(props, 1)
 
-        self._undo_stack: List[List[Action]] = []
-        self._redo_stack: List[List[Action]] = []
+        self._undo_stack: Deque[EditOp] = deque(maxlen=_UNDO_LIMIT)
+        self._redo_stack: Deque[EditOp] = deque(maxlen=_UNDO_LIMIT)
+        self._replaying = False
+        self.model.rowsMoved.connect(self._on_rows_moved)
 
         self.btn_add.clicked.connect(self.add_action)
         self.btn_remove.clicked.connect(self.remove_selected)
@@ -114,53 +328,120 @@ class MacroEditor(QWidget):
         self.btn_add_label.clicked.connect(self.add_label_action)
 
         self.pick_captured.connect(self._on_pick_captured)
+        # One global mouse hook, installed on the first pick and kept for the
+        # editor's lifetime; clicks only count while a pick is armed
+        self._picker_listener = None
+        self._pick_armed = threading.Event()
 
     # Public API
 
     def set_actions(self, actions: List[Action]) -> None:
-        self.timeline.clear()
-        for a in actions:
-            item = QListWidgetItem(self._format_action(a))
-            item.setData(Qt.ItemDataRole.UserRole, a)
-            self.timeline.addItem(item)
-        self.actions_changed.emit()
+        # One model reset; the view only lays out the rows it shows. Recorded
+        # edits refer to rows of the old list, so history starts over
+        self.model.set_actions(actions)
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._notify_changed()
 
     def actions(self) -> List[Action]:
-        out: List[Action] = []
-        for i in range(self.timeline.count()):
-            item = self.timeline.item(i)
-            a: Action = item.data(Qt.ItemDataRole.UserRole)
-            out.append(a)
-        return out
+        return self.model.actions()
+
+    def first_of_type(self, type_: str) -> Optional[Action]:
+        of_type = self.model.actions_of_type(type_)
+        return of_type[0] if of_type else None
+
+    def _notify_changed(self) -> None:
+        self._changed_timer.start()
+
+    def current_action(self) -> Optional[Action]:
+        idx = self.timeline.currentIndex()
+        return self.model.action(idx.row()) if idx.isValid() else None
+
+    def refresh_current(self) -> None:
+        """Re-render the selected row after its Action was changed in place."""
+        idx = self.timeline.currentIndex()
+        if idx.isValid():
+            self.model.action_changed(idx.row())
+            self._notify_changed()
+
+    def append_action(self, a: Action) -> None:
+        """Append one action as an undoable insert, without resetting the model."""
+        row = self.model.rowCount()
+        self._record(EditOp("insert", row, after=a))
+        self.model.insert_action(row, a)
+        self.timeline.setCurrentIndex(self.model.index(row))
+        self._notify_changed()
+
+    def append_actions(self, actions: List[Action]) -> None:
+        """Append a batch (e.g. a recording) as one insert and one undoable edit."""
+        if not actions:
+            return
+        row = self.model.rowCount()
+        actions = list(actions)
+        self._record(EditOp("extend", row, after=actions))
+        self.model.insert_actions(row, actions)
+        self.timeline.setCurrentIndex(self.model.index(row + len(actions) - 1))
+        self._notify_changed()
 
     # Undo/Redo
 
-    def _snapshot(self) -> List[Action]:
-        return [
-            self.timeline.item(idx).data(Qt.ItemDataRole.UserRole)
-            for idx in range(self.timeline.count())
-        ]
-
-    def _push_undo(self) -> None:
-        self._undo_stack.append(self._snapshot())
+    def _record(self, op: EditOp) -> None:
+        self._undo_stack.append(op)
         # clear redo when new change happens
         self._redo_stack.clear()
 
+    def _on_rows_moved(self, parent: QModelIndex, start: int, end: int, dest: QModelIndex, dest_row: int) -> None:
+        if not self._replaying:
+            final = dest_row - 1 if dest_row > start else dest_row
+            self._record(EditOp("move", start, before=start, after=final))
+
+    def _apply(self, op: EditOp, forward: bool) -> None:
+        """Replay op (forward) or its inverse directly on the model."""
+        self._replaying = True
+        try:
+            row = op.index
+            if (op.kind == "insert") == forward and op.kind in ("insert", "remove"):
+                self.model.insert_action(row, op.after if forward else op.before)
+            elif op.kind in ("insert", "remove"):
+                self.model.removeRows(row, 1)
+                row = min(row, self.model.rowCount() - 1)
+            elif op.kind == "extend":
+                if forward:
+                    self.model.insert_actions(row, op.after)
+                    row += len(op.after) - 1
+                else:
+                    self.model.removeRows(row, len(op.after))
+                    row = min(row, self.model.rowCount() - 1)
+            elif op.kind == "edit":
+                a = self.model.action(row)
+                for name, value in (op.after if forward else op.before).items():
+                    setattr(a, name, value)
+                self.model.action_changed(row)
+            elif op.kind == "move":
+                src, row = (op.before, op.after) if forward else (op.after, op.before)
+                self.model.moveRow(QModelIndex(), src, QModelIndex(), row + 1 if row > src else row)
+        finally:
+            self._replaying = False
+        if row >= 0:
+            self.timeline.setCurrentIndex(self.model.index(row))
+            if op.kind == "edit":
+                # Same row stays current, so refresh the inspector by hand
+                self._on_selection_changed(self.model.index(row), QModelIndex())
+        self._notify_changed()
+
     def undo(self) -> None:
         if not self._undo_stack:
             return
-        current = self._snapshot()
-        prev = self._undo_stack.pop()
-        self._redo_stack.append(current)
-        self.set_actions(prev)
+        op = self._undo_stack.pop()
+        self._apply(op, forward=False)
+        self._redo_stack.append(op)
 
     def redo(self) -> None:
         if not self._redo_stack:
             return
-        current = self._snapshot()
-        nxt = self._redo_stack.pop()
-        self._undo_stack.append(current)
-        self.set_actions(nxt)
+        op = self._redo_stack.pop()
+        self._apply(op, forward=True)
+        self._undo_stack.append(op)
 
     # Handlers
 
@@ -169,9 +450,8 @@ class MacroEditor(QWidget):
         self.add_wait_action()
 
     def add_wait_action(self) -> None:
-        self._push_undo()
         a = Action(
-            id=f"a{self.timeline.count()+1}",
+            id=f"a{self.model.rowCount()+1}",
             type="wait",
             target=None,
             params={"ms": 500},
@@ -179,69 +459,54 @@ class MacroEditor(QWidget):
             delay_after_ms=0,
             repeat_count=1,
         )
-        item = QListWidgetItem(self._format_action(a))
-        item.setData(Qt.ItemDataRole.UserRole, a)
-        self.timeline.addItem(item)
-        self.timeline.setCurrentItem(item)
-        self.actions_changed.emit()
+        self.append_action(a)
 
     def add_keyseq_action(self) -> None:
-        self._push_undo()
         a = Action(
-            id=f"a{self.timeline.count()+1}",
+            id=f"a{self.model.rowCount()+1}",
             type="key_sequence",
             target=None,
             params={"sequence": ["Hello world", "ENTER"], "text_mode": True},
         )
-        item = QListWidgetItem(self._format_action(a))
-        item.setData(Qt.ItemDataRole.UserRole, a)
-        self.timeline.addItem(item)
-        self.timeline.setCurrentItem(item)
-        self.actions_changed.emit()
+        self.append_action(a)
 
     def add_label_action(self) -> None:
-        self._push_undo()
-        name = f"label_{self.timeline.count()+1}"
+        name = f"label_{self.model.rowCount()+1}"
         a = Action(
             id=name,
             type="label",
             target=name,
             params={},
         )
-        item = QListWidgetItem(self._format_action(a))
-        item.setData(Qt.ItemDataRole.UserRole, a)
-        self.timeline.addItem(item)
-        self.timeline.setCurrentItem(item)
-        self.actions_changed.emit()
+        self.append_action(a)
 
-    # Click picker using a one-shot global mouse listener
+    # Click picker using a persistent global mouse listener
     def add_click_pick(self) -> None:
+        if _pynput_mouse is None:
+            QMessageBox.warning(self, "Pick Click", "Global mouse capture is unavailable (pynput could not be loaded).")
+            return
+        if self._picker_listener is None or not self._picker_listener.is_alive():
+            self._picker_listener = _pynput_mouse.Listener(on_click=self._global_on_click)
+            self._picker_listener.start()
+            self.destroyed.connect(self._picker_listener.stop)
         # Hide the window temporarily to avoid accidental clicks inside the app
         w = self.window()
         if w:
             w.hide()
+        self._pick_armed.set()
 
-        def _worker():
-            from pynput import mouse
-
-            def on_click(x, y, button, pressed):
-                if pressed:
-                    # Emit signal to UI thread and stop listener
-                    self.pick_captured.emit(int(x), int(y))
-                    return False
-                return True
-
-            with mouse.Listener(on_click=on_click) as listener:
-                listener.join()
-
-        threading.Thread(target=_worker, daemon=True).start()
+    def _global_on_click(self, x, y, button, pressed) -> None:
+        # Runs on the listener thread; the signal is delivered queued to the UI thread
+        if pressed and self._pick_armed.is_set():
+            self._pick_armed.clear()
+            self.pick_captured.emit(int(x), int(y))
 
     def remove_selected(self) -> None:
-        idx = self.timeline.currentRow()
-        if idx >= 0:
-            self._push_undo()
-            self.timeline.takeItem(idx)
-            self.actions_changed.emit()
+        idx = self.timeline.currentIndex()
+        if idx.isValid():
+            self._record(EditOp("remove", idx.row(), before=self.model.action(idx.row())))
+            self.model.removeRows(idx.row(), 1)
+            self._notify_changed()
 
     def _on_pick_captured(self, x: int, y: int) -> None:
         # Restore window
@@ -252,25 +517,19 @@ class MacroEditor(QWidget):
             w.activateWindow()
 
         # Add mouse_click action with captured coordinates
-        self._push_undo()
         a = Action(
-            id=f"a{self.timeline.count()+1}",
+            id=f"a{self.model.rowCount()+1}",
             type="mouse_click",
             target=None,
             params={"x": x, "y": y, "button": "left"},
         )
-        item = QListWidgetItem(self._format_action(a))
-        item.setData(Qt.ItemDataRole.UserRole, a)
-        self.timeline.addItem(item)
-        self.timeline.setCurrentItem(item)
-        self.actions_changed.emit()
+        self.append_action(a)
 
     def apply_changes(self) -> None:
-        item = self.timeline.currentItem()
-        if not item:
+        a = self.current_action()
+        if a is None:
             return
-        self._push_undo()
-        a: Action = item.data(Qt.ItemDataRole.UserRole)
+        before = _editable_fields(a)
 
         a.id = self.input_id.text().strip() or a.id
         a.type = self.input_type.currentText()
@@ -279,9 +538,11 @@ class MacroEditor(QWidget):
 
         raw = self.input_params.text().strip()
         params = {}
-        if raw:
+        if raw and raw == a._params_json:
+            # Params text untouched since selection: nothing to parse
+            params = a.params
+        elif raw:
             try:
-                import json
                 params = json.loads(raw)
             except Exception:
                 for part in raw.split(","):
@@ -294,50 +555,51 @@ class MacroEditor(QWidget):
         a.delay_after_ms = int(self.input_delay_after.value())
         a.repeat_count = int(self.input_repeat.value())
 
-        item.setText(self._format_action(a))
-        item.setData(Qt.ItemDataRole.UserRole, a)
-        self.actions_changed.emit()
+        self._record(EditOp("edit", self.timeline.currentIndex().row(), before=before, after=_editable_fields(a)))
+        self.refresh_current()
+        self._notify_changed()
 
-    def _on_selection_changed(self, cur: QListWidgetItem | None, prev: QListWidgetItem | None) -> None:
-        if not cur:
+    def _on_selection_changed(self, cur: QModelIndex, prev: QModelIndex) -> None:
+        if not cur.isValid():
             return
         a: Action = cur.data(Qt.ItemDataRole.UserRole)
         self.input_id.setText(a.id)
         idx = max(0, self.input_type.findText(a.type))
         self.input_type.setCurrentIndex(idx)
         self.input_target.setText(a.target or "")
-        try:
-            import json
-            self.input_params.setText(json.dumps(a.params))
-        except Exception:
-            self.input_params.setText(str(a.params))
+        self.input_params.setText(self._params_text(a))
         self.input_delay_before.setValue(int(a.delay_before_ms))
         self.input_delay_after.setValue(int(a.delay_after_ms))
         self.input_repeat.setValue(int(a.repeat_count))
 
+    def _params_text(self, a: Action) -> str:
+        if a._params_json is None:
+            try:
+                a._params_json = json.dumps(a.params)
+            except Exception:
+                return str(a.params)
+        return a._params_json
+
     def _format_action(self, a: Action) -> str:
-        core = f"{a.id}: {a.type}"
-        if a.type == "wait":
-            ms = a.params.get("ms", 0)
-            core += f" ({ms} ms)"
-        elif a.type == "mouse_click":
-            x = a.params.get("x")
-            y = a.params.get("y")
-            btn = a.params.get("button", "left")
-            core += f" ({btn} @ {x},{y})"
-        elif a.type == "key_sequence":
-            seq = a.params.get("sequence", [])
-            core += f" ({' '.join(map(str, seq))})"
-        elif a.type == "detect":
-            tgt = a.target or ""
-            thr = a.params.get("conf", "")
-            core += f" ({tgt}, conf={thr})"
-        elif a.type == "conditional_jump":
-            params = a.params or {}
-            core += f" (true->{params.get('true_target')}, false->{params.get('false_target')})"
-        elif a.type == "label":
-            core += f" ({a.target or a.id})"
-        elif a.type == "loop_until":
-            params = a.params or {}
-            core += f" (label={params.get('label')}, max={params.get('max_iters', 0)})"
-        return core
\ No newline at end of file
+        if a._display_cache is not None:
+            return a._display_cache
+        fmt = self._FORMATTERS.get(a.type)
+        core = f"{a.id}: {a.type}" + (fmt(a) if fmt else "")
+        a._display_cache = core
+        return core
+
+    # Per-type suffix for timeline rows; one lookup instead of a branch chain
+    _FORMATTERS: dict[str, Callable[[Action], str]] = {
+        "wait": lambda a: f" ({a.params.get('ms', 0)} ms)",
+        "mouse_click": lambda a: f" ({a.params.get('button', 'left')} @ {a.params.get('x')},{a.params.get('y')})",
+        "key_sequence": lambda a: f" ({' '.join(map(str, a.params.get('sequence', [])))})",
+        "detect": lambda a: f" ({a.target or ''}, conf={a.params.get('conf', '')})",
+        "detect_any": lambda a: (
+            f" ({len(a.params.get('targets', [])) + (1 if a.target else 0)} templates, conf={a.params.get('conf', '')})"
+        ),
+        "conditional_jump": lambda a: (
+            f" (true->{(a.params or {}).get('true_target')}, false->{(a.params or {}).get('false_target')})"
+        ),
+        "label": lambda a: f" ({a.target or a.id})",
+        "loop_until": lambda a: f" (label={(a.params or {}).get('label')}, max={(a.params or {}).get('max_iters', 0)})",
+    }
\ No newline at end of file
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List, Dict, Tuple
+import math
+from typing import List, Dict, Optional, Tuple
 
 from PySide6.QtCore import QPointF, QRectF
 from PySide6.QtGui import QPen, QColor, QPolygonF, QPainter
@@ -8,13 +9,37 @@ from PySide6.QtWidgets import (
     QGraphicsView,
     QGraphicsScene,
     QGraphicsEllipseItem,
-    QGraphicsTextItem,
+    QGraphicsSimpleTextItem,
     QGraphicsLineItem,
     QGraphicsPolygonItem,
 )
 
 from autoclick_pro.data.model import Action
 
+# (action id, occurrence) and (source node, target node, edge kind)
+NodeKey = Tuple[str, int]
+EdgeKey = Tuple[NodeKey, NodeKey, str]
+
+_NODE_COLOR = "#4f9cf9"
+_TEXT_COLOR = "#e0e0e0"
+_EDGE_COLORS = {"next": "#888", "true": "#44c767", "false": "#d9534f", "loop": "#f0ad4e"}
+# Layout: improved spacing, staggered x positions by type
+_X_START = 40.0
+_Y_START = 30.0
+_DY = 90.0
+_X_BY_TYPE = {
+    "label": _X_START,
+    "detect": _X_START + 120.0,
+    "detect_any": _X_START + 120.0,
+    "conditional_jump": _X_START + 240.0,
+    "loop_until": _X_START + 360.0,
+}
+_X_DEFAULT = _X_START + 180.0
+_NODE_RADIUS = 18.0
+# Arrowhead half-angle (30 degrees)
+_COS_HEAD = math.cos(math.pi / 6)
+_SIN_HEAD = math.sin(math.pi / 6)
+
 
 class FlowView(QGraphicsView):
     """
@@ -26,88 +51,142 @@ class FlowView(QGraphicsView):
         self.setRenderHint(QPainter.Antialiasing)
         # Ensure scene background matches dark theme and text is readable
         self.scene().setBackgroundBrush(QColor("#1e1f22"))
+        # Pens and colours are shared by every item instead of parsed per item
+        self._node_pen = QPen(QColor(_NODE_COLOR), 2)
+        self._text_color = QColor(_TEXT_COLOR)
+        self._edge_styles = {kind: (QPen(QColor(c), 2), QColor(c)) for kind, c in _EDGE_COLORS.items()}
+        # Items from the previous render, updated in place by render_actions
+        self._nodes: Dict[NodeKey, Tuple[QGraphicsEllipseItem, QGraphicsSimpleTextItem]] = {}
+        self._edges: Dict[EdgeKey, Tuple[QGraphicsLineItem, QGraphicsPolygonItem, Optional[QGraphicsSimpleTextItem]]] = {}
 
-    def _arrow(self, src: QPointF, dst: QPointF, color: str = "#888", label: str | None = None):
-        scene = self.scene()
-        line = QGraphicsLineItem(src.x(), src.y(), dst.x(), dst.y())
-        line.setPen(QPen(QColor(color), 2))
-        scene.addItem(line)
-        # Arrowhead
-        import math
-        angle = math.atan2(dst.y() - src.y(), dst.x() - src.x())
+    def _arrow(self, key: EdgeKey, x1: float, y1: float, x2: float, y2: float, label: str | None = None) -> None:
+        # Reuse the line/arrowhead/label of an edge drawn on the previous render;
+        # the edge kind (last key part) picks the colour
+        edge = self._edges.get(key)
+        if edge is None:
+            scene = self.scene()
+            pen, fill = self._edge_styles[key[2]]
+            line = QGraphicsLineItem()
+            line.setPen(pen)
+            scene.addItem(line)
+            tri = QGraphicsPolygonItem()
+            tri.setPen(pen)
+            tri.setBrush(fill)
+            scene.addItem(tri)
+            t = None
+            if label:
+                t = QGraphicsSimpleTextItem(label)
+                t.setBrush(self._text_color)
+                scene.addItem(t)
+            edge = self._edges[key] = (line, tri, t)
+        line, tri, t = edge
+        line.setLine(x1, y1, x2, y2)
+        # Arrowhead: the line direction rotated by +-30 degrees, no trig per arrow
+        dx, dy = x2 - x1, y2 - y1
+        n = math.hypot(dx, dy)
+        ux, uy = (dx / n, dy / n) if n else (1.0, 0.0)
         size = 8.0
-        p1 = dst
-        p2 = QPointF(dst.x() - size * math.cos(angle - math.pi / 6), dst.y() - size * math.sin(angle - math.pi / 6))
-        p3 = QPointF(dst.x() - size * math.cos(angle + math.pi / 6), dst.y() - size * math.sin(angle + math.pi / 6))
-        tri = QGraphicsPolygonItem(QPolygonF([p1, p2, p3]))
-        tri.setPen(QPen(QColor(color), 2))
-        tri.setBrush(QColor(color))
-        scene.addItem(tri)
+        p1 = QPointF(x2, y2)
+        p2 = QPointF(x2 - size * (ux * _COS_HEAD + uy * _SIN_HEAD), y2 - size * (uy * _COS_HEAD - ux * _SIN_HEAD))
+        p3 = QPointF(x2 - size * (ux * _COS_HEAD - uy * _SIN_HEAD), y2 - size * (uy * _COS_HEAD + ux * _SIN_HEAD))
+        tri.setPolygon(QPolygonF([p1, p2, p3]))
         # Label
-        if label:
-            mid = QPointF((src.x() + dst.x()) / 2, (src.y() + dst.y()) / 2)
-            t = QGraphicsTextItem(label)
-            t.setDefaultTextColor(QColor("#e0e0e0"))
-            t.setPos(mid.x() + 4, mid.y() - 18)
-            scene.addItem(t)
+        if t is not None:
+            t.setPos((x1 + x2) / 2 + 8, (y1 + y2) / 2 - 14)
 
     def render_actions(self, actions: List[Action]) -> None:
+        """
+        Lay out the actions, updating the items of the previous render in place:
+        nodes are keyed by action id (plus occurrence, for duplicate ids) and
+        edges by (source, target, kind), so only added or removed ones allocate
+        or free scene items.
+        """
+        scene = self.scene()
+        self.setUpdatesEnabled(False)
+        try:
+            self._layout(actions)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        rect = scene.itemsBoundingRect()
+        scene.setSceneRect(QRectF(rect.x() - 40, rect.y() - 40, rect.width() + 80, rect.height() + 80))
+
+    def _layout(self, actions: List[Action]) -> None:
         scene = self.scene()
-        scene.clear()
-
-        # Layout: improved spacing, staggered x positions by type
-        x_start = 40.0
-        y_start = 30.0
-        dy = 90.0
-        x_map = {
-            "label": x_start,
-            "detect": x_start + 120.0,
-            "conditional_jump": x_start + 240.0,
-            "loop_until": x_start + 360.0,
-            "default": x_start + 180.0,
-        }
-        node_radius = 18.0
-
-        id_pos: Dict[str, QPointF] = {}
+
+        # Column per type and row per index, resolved for every action up front;
+        # the loop below only touches items
+        xs = [_X_BY_TYPE.get(a.type, _X_DEFAULT) for a in actions]
+        ys = [_Y_START + _DY * i for i in range(len(actions))]
+        xy = list(zip(xs, ys))
+        r = _NODE_RADIUS
+
+        keys: List[NodeKey] = []
+        seen: Dict[str, int] = {}
+        id_idx: Dict[str, int] = {}  # last occurrence wins, as for jumps
+        branches: List[int] = []
         for idx, a in enumerate(actions):
-            y = y_start + idx * dy
-            x = x_map.get(a.type, x_map["default"])
-            pos = QPointF(x, y)
-            # Node circle
-            circle = QGraphicsEllipseItem(pos.x() - node_radius, pos.y() - node_radius, node_radius * 2, node_radius * 2)
-            circle.setPen(QPen(QColor("#4f9cf9"), 2))
-            scene.addItem(circle)
-            # Label
-            label = QGraphicsTextItem(f"{a.id}\n{a.type}")
-            label.setDefaultTextColor(QColor("#e0e0e0"))
-            label.setPos(pos.x() + node_radius + 8, pos.y() - node_radius)
-            scene.addItem(label)
-            id_pos[a.id] = pos
-
-            # Sequential arrow to next
-            if idx < len(actions) - 1:
-                next_pos = QPointF(x_map.get(actions[idx + 1].type, x_map["default"]), y_start + (idx + 1) * dy)
-                self._arrow(QPointF(pos.x(), pos.y() + node_radius), QPointF(next_pos.x(), next_pos.y() - node_radius), "#888")
-
-        # Branches: conditional_jump true/false targets
-        for a in actions:
+            key = (a.id, seen.get(a.id, 0))
+            seen[a.id] = key[1] + 1
+            keys.append(key)
+            x, y = xy[idx]
+            node = self._nodes.get(key)
+            if node is None:
+                # Node circle
+                circle = QGraphicsEllipseItem()
+                circle.setPen(self._node_pen)
+                scene.addItem(circle)
+                # Label
+                label = QGraphicsSimpleTextItem()
+                label.setBrush(self._text_color)
+                scene.addItem(label)
+                node = self._nodes[key] = (circle, label)
+            circle, label = node
+            circle.setRect(x - r, y - r, r * 2, r * 2)
+            text = f"{a.id}\n{a.type}"
+            if label.text() != text:
+                label.setText(text)
+            # Offsets include the 4 px inset the former QGraphicsTextItem labels had
+            label.setPos(x + r + 12, y - r + 4)
+            id_idx[a.id] = idx
+            if a.type in ("conditional_jump", "loop_until"):
+                branches.append(idx)
+
+        live_edges = set()
+        # Sequential arrow to next
+        for idx in range(len(actions) - 1):
+            (x, y), (nx, ny) = xy[idx], xy[idx + 1]
+            ekey = (keys[idx], keys[idx + 1], "next")
+            live_edges.add(ekey)
+            self._arrow(ekey, x, y + r, nx, ny - r)
+
+        # Branches: conditional_jump true/false targets and loop_until back to its label
+        for idx in branches:
+            a = actions[idx]
+            params = a.params or {}
+            sx, sy = xy[id_idx[a.id]]
             if a.type == "conditional_jump":
-                params = a.params or {}
-                src = id_pos.get(a.id)
-                for key, color, text in [("true_target", "#44c767", "true"), ("false_target", "#d9534f", "false")]:
-                    tgt = params.get(key)
-                    if src and tgt and tgt in id_pos:
-                        dst = id_pos[tgt]
-                        self._arrow(QPointF(src.x() + node_radius, src.y()), QPointF(dst.x() - node_radius, dst.y()), color, text)
-
-        # Loops: loop_until back to label
-        for a in actions:
-            if a.type == "loop_until":
-                label_name = a.params.get("label") if a.params else None
-                src = id_pos.get(a.id)
-                dst = id_pos.get(label_name) or id_pos.get(label_name or "")
-                if src and dst:
-                    self._arrow(QPointF(src.x(), src.y() - node_radius), QPointF(dst.x(), dst.y() + node_radius), "#f0ad4e", "loop")
+                for kind in ("true", "false"):
+                    t = id_idx.get(params.get(f"{kind}_target"))
+                    if t is not None:
+                        ekey = (keys[id_idx[a.id]], keys[t], kind)
+                        live_edges.add(ekey)
+                        tx, ty = xy[t]
+                        self._arrow(ekey, sx + r, sy, tx - r, ty, kind)
+            else:
+                t = id_idx.get(params.get("label") or "")
+                if t is not None:
+                    ekey = (keys[id_idx[a.id]], keys[t], "loop")
+                    live_edges.add(ekey)
+                    tx, ty = xy[t]
+                    self._arrow(ekey, sx, sy - r, tx, ty + r, "loop")
 
-        rect = scene.itemsBoundingRect()
-        scene.setSceneRect(QRectF(rect.x() - 40, rect.y() - 40, rect.width() + 80, rect.height() + 80))
\ No newline at end of file
+        # Drop whatever the new action list no longer has
+        live_nodes = set(keys)
+        for key in [k for k in self._nodes if k not in live_nodes]:
+            for item in self._nodes.pop(key):
+                scene.removeItem(item)
+        for key in [k for k in self._edges if k not in live_edges]:
+            for item in self._edges.pop(key):
+                if item is not None:
+                    scene.removeItem(item)
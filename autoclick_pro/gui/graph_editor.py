@@ -1,21 +1,36 @@
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
-from PySide6.QtCore import QPointF, Signal
-from PySide6.QtGui import QPen, QColor, QPainter
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QPen, QColor, QPainter, QTransform
 from PySide6.QtWidgets import (
     QWidget,
     QGraphicsView,
     QGraphicsScene,
     QGraphicsEllipseItem,
-    QGraphicsTextItem,
+    QGraphicsSimpleTextItem,
     QVBoxLayout,
 )
 
 from autoclick_pro.data.model import Action
 
 
+class _GraphScene(QGraphicsScene):
+    """Scene that reports double-clicks on action nodes."""
+    node_double_clicked = Signal(str)
+
+    def mouseDoubleClickEvent(self, event) -> None:
+        # Topmost item only; node items are never transformed, so the identity
+        # device transform is enough
+        it = self.itemAt(event.scenePos(), QTransform())
+        if isinstance(it, QGraphicsEllipseItem):
+            action_id = it.data(0)
+            if action_id:
+                self.node_double_clicked.emit(str(action_id))
+        super().mouseDoubleClickEvent(event)
+
+
 class GraphEditor(QWidget):
     """
     Minimal graph-based editor:
@@ -28,55 +43,76 @@ class GraphEditor(QWidget):
         super().__init__(parent)
         v = QVBoxLayout(self)
         self.view = QGraphicsView()
-        self.scene = QGraphicsScene(self.view)
+        self.scene = _GraphScene(self.view)
         self.view.setScene(self.scene)
         self.view.setRenderHint(QPainter.Antialiasing)
+        # Dragging a node repaints only the regions it leaves and enters
+        self.view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
         # Match dark theme background
         self.scene.setBackgroundBrush(QColor("#1e1f22"))
         v.addWidget(self.view)
 
-        # Node registry
-        self._nodes: Dict[str, QGraphicsEllipseItem] = {}
+        # Shared by every node instead of parsed per item
+        self._node_pen = QPen(QColor("#4f9cf9"), 2)
+        self._text_color = QColor("#e0e0e0")
+
+        # Node registry, kept across renders: (action id, occurrence) ->
+        # (circle, label, position the layout last gave the circle)
+        self._nodes: Dict[Tuple[str, int], Tuple[QGraphicsEllipseItem, QGraphicsSimpleTextItem, Tuple[float, float]]] = {}
+        self.scene.node_double_clicked.connect(self.node_activated)
 
     def render_actions(self, actions: List[Action]) -> None:
-        self.scene.clear()
-        self._nodes.clear()
+        # Rebuild with the view frozen: one repaint instead of one per added item
+        self.view.setUpdatesEnabled(False)
+        try:
+            self._populate(actions)
+        finally:
+            self.view.setUpdatesEnabled(True)
 
+    def _populate(self, actions: List[Action]) -> None:
         # Simple grid layout
         x0, y0 = 30.0, 30.0
         dx, dy = 200.0, 120.0
         per_row = 3
         radius = 20.0
 
+        live = set()
+        seen: Dict[str, int] = {}
         for idx, a in enumerate(actions):
+            key = (a.id, seen.get(a.id, 0))
+            seen[a.id] = key[1] + 1
+            live.add(key)
             row = idx // per_row
             col = idx % per_row
             x = x0 + col * dx
             y = y0 + row * dy
-            circle = QGraphicsEllipseItem(x, y, radius * 2, radius * 2)
-            circle.setPen(QPen(QColor("#4f9cf9"), 2))
-            circle.setData(0, a.id)  # store id
-            circle.setFlag(QGraphicsEllipseItem.GraphicsItemFlag.ItemIsMovable, True)
-            circle.setFlag(QGraphicsEllipseItem.GraphicsItemFlag.ItemIsSelectable, True)
-            self.scene.addItem(circle)
-            self._nodes[a.id] = circle
-
-            label = QGraphicsTextItem(f"{a.id}\n{a.type}")
-            label.setDefaultTextColor(QColor("#e0e0e0"))
-            label.setPos(x + radius * 2 + 6, y - 2)
-            self.scene.addItem(label)
-
-        # Connect double-click via scene event filter-like approach
-        self.scene.mouseDoubleClickEvent = self._on_double_click  # type: ignore
+            text = f"{a.id}\n{a.type}"
+            node = self._nodes.get(key)
+            if node is None:
+                circle = QGraphicsEllipseItem(0, 0, radius * 2, radius * 2)
+                circle.setPen(self._node_pen)
+                circle.setData(0, a.id)  # store id
+                circle.setFlag(QGraphicsEllipseItem.GraphicsItemFlag.ItemIsMovable, True)
+                circle.setFlag(QGraphicsEllipseItem.GraphicsItemFlag.ItemIsSelectable, True)
+                # Drags blit the cached antialiased node instead of redrawing it per frame
+                circle.setCacheMode(QGraphicsEllipseItem.CacheMode.DeviceCoordinateCache)
+                # Label rides along with its node when dragged
+                label = QGraphicsSimpleTextItem(text, circle)
+                label.setBrush(self._text_color)
+                label.setPos(radius * 2 + 10, 2)
+                label.setCacheMode(QGraphicsSimpleTextItem.CacheMode.DeviceCoordinateCache)
+                circle.setPos(x, y)
+                self.scene.addItem(circle)
+            else:
+                circle, label, laid_out = node
+                # A node the user dragged away from its slot stays where it was put
+                if (circle.x(), circle.y()) == laid_out:
+                    circle.setPos(x, y)
+                else:
+                    x, y = laid_out
+                if label.text() != text:
+                    label.setText(text)
+            self._nodes[key] = (circle, label, (x, y))
 
-    def _on_double_click(self, event):
-        pos = event.scenePos()
-        items = self.scene.items(pos)
-        for it in items:
-            if isinstance(it, QGraphicsEllipseItem):
-                action_id = it.data(0)
-                if action_id:
-                    self.node_activated.emit(str(action_id))
-                    break
-        # Call base handler
-        super(QGraphicsScene, self.scene).mouseDoubleClickEvent(event)
\ No newline at end of file
+        for key in [k for k in self._nodes if k not in live]:
+            self.scene.removeItem(self._nodes.pop(key)[0])
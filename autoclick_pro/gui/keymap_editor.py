@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import sys
 from typing import List
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QGridLayout,
+    QButtonGroup,
     QPushButton,
     QCheckBox,
     QLineEdit,
@@ -23,6 +25,13 @@ KEYS = [
     ["CTRL", "ALT", "META", "SPACE", "ALT", "CTRL"],
 ]
 
+_KEY_POSITIONS: tuple[tuple[int, int, str], ...] = tuple(
+    (r, c, k) for r, row in enumerate(KEYS) for c, k in enumerate(row)
+)
+_MODS = frozenset({"CTRL", "SHIFT", "ALT", "META"})
+_MOD_NAMES = ("ctrl", "shift", "alt", "cmd")  # order of the modifier checkboxes
+_KEY_LOWER: dict[str, str] = {k: sys.intern(k.lower()) for row in KEYS for k in row}
+
 
 class KeymapEditor(QDialog):
     """
@@ -40,10 +49,12 @@ class KeymapEditor(QDialog):
         hmode = QHBoxLayout()
         self.chk_chord = QCheckBox("Chord")
         self.chk_sequence = QCheckBox("Sequence")
+        # Exclusive group: Qt keeps exactly one mode checked
+        self._mode_group = QButtonGroup(self)
+        self._mode_group.setExclusive(True)
+        self._mode_group.addButton(self.chk_chord)
+        self._mode_group.addButton(self.chk_sequence)
         self.chk_chord.setChecked(True)
-        self.chk_sequence.setChecked(False)
-        self.chk_chord.toggled.connect(lambda c: self.chk_sequence.setChecked(not c))
-        self.chk_sequence.toggled.connect(lambda c: self.chk_chord.setChecked(not c))
         hmode.addWidget(self.chk_chord)
         hmode.addWidget(self.chk_sequence)
         hmode.addStretch()
@@ -64,19 +75,17 @@ class KeymapEditor(QDialog):
 
         # Keyboard grid
         grid = QGridLayout()
-        self.selected_keys: List[str] = []
+        self.selected_keys: dict[str, None] = {}  # insertion-ordered set
         self.key_buttons: dict[str, QPushButton] = {}
-        row = 0
-        for row_keys in KEYS:
-            col = 0
-            for k in row_keys:
-                btn = QPushButton(k)
-                btn.setCheckable(True)
-                btn.clicked.connect(lambda _, name=k: self._toggle_key(name))
-                grid.addWidget(btn, row, col)
-                self.key_buttons[k] = btn
-                col += 1
-            row += 1
+        grid.setHorizontalSpacing(2)
+        grid.setVerticalSpacing(2)
+        grid.setContentsMargins(0, 0, 0, 0)
+        for r, c, k in _KEY_POSITIONS:
+            btn = QPushButton(k)
+            btn.setCheckable(True)
+            btn.clicked.connect(self._on_key_button)
+            grid.addWidget(btn, r, c)
+            self.key_buttons[k] = btn
         v.addLayout(grid)
 
         # Sequence line edit
@@ -98,31 +107,36 @@ class KeymapEditor(QDialog):
         self.btn_save.clicked.connect(self.accept)
         self.btn_cancel.clicked.connect(self.reject)
 
-    def _toggle_key(self, name: str) -> None:
-        if name in self.selected_keys:
-            self.selected_keys.remove(name)
+    def reset(self) -> None:
+        """Return a reused dialog to its freshly-built state without rebuilding the key grid."""
+        self.chk_chord.setChecked(True)
+        for chk in (self.mod_ctrl, self.mod_shift, self.mod_alt, self.mod_meta):
+            chk.setChecked(False)
+        # Duplicated keys (SHIFT, CTRL, ALT) have two buttons, so check the whole grid
+        for btn in self.findChildren(QPushButton):
+            if btn.isChecked():
+                btn.setChecked(False)
+        self.selected_keys.clear()
+        self.input_sequence.clear()
+
+    @Slot(bool)
+    def _on_key_button(self, checked: bool) -> None:
+        # One slot for the whole grid; the button has already toggled itself and
+        # its caption is the key name
+        name = self.sender().text()
+        if checked:
+            self.selected_keys[name] = None
         else:
-            self.selected_keys.append(name)
-        # Visual toggle
-        btn = self.key_buttons.get(name)
-        if btn:
-            btn.setChecked(name in self.selected_keys)
+            self.selected_keys.pop(name, None)
 
     def result_action(self) -> dict | None:
         """
         Returns a key_sequence or chord action dict for the macro editor.
         """
         if self.chk_chord.isChecked():
-            keys: List[str] = []
-            if self.mod_ctrl.isChecked():
-                keys.append("ctrl")
-            if self.mod_shift.isChecked():
-                keys.append("shift")
-            if self.mod_alt.isChecked():
-                keys.append("alt")
-            if self.mod_meta.isChecked():
-                keys.append("cmd")
-            keys.extend([k.lower() for k in self.selected_keys if k not in {"CTRL", "SHIFT", "ALT", "META"}])
+            mods = (self.mod_ctrl, self.mod_shift, self.mod_alt, self.mod_meta)
+            keys: List[str] = [name for name, chk in zip(_MOD_NAMES, mods) if chk.isChecked()]
+            keys.extend(_KEY_LOWER[k] for k in self.selected_keys if k not in _MODS)
             if not keys:
                 return None
             return {"type": "key_sequence", "params": {"sequence": keys, "text_mode": False}}
@@ -131,5 +145,5 @@ class KeymapEditor(QDialog):
             if not txt:
                 return None
             # Split by whitespace, treat ENTER/TAB/ESC specially
-            seq = [part for part in txt.split()]
+            seq = txt.split()
             return {"type": "key_sequence", "params": {"sequence": seq, "text_mode": True}}
\ No newline at end of file
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from typing import List
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QListWidget, QHBoxLayout, QPushButton, QLineEdit, QLabel
+from PySide6.QtCore import QStringListModel, Qt
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QListView, QHBoxLayout, QPushButton, QLineEdit, QLabel
 
 from autoclick_pro.data.model import Action
 
@@ -18,7 +18,11 @@ class LabelManager(QDialog):
         self.resize(450, 400)
         v = QVBoxLayout(self)
 
-        self.list = QListWidget()
+        self._model = QStringListModel(self)
+        self.list = QListView()
+        self.list.setModel(self._model)
+        self.list.setUniformItemSizes(True)
+        self.list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         v.addWidget(QLabel("Existing labels"))
         v.addWidget(self.list)
 
@@ -36,13 +40,31 @@ class LabelManager(QDialog):
         self.btn_close.clicked.connect(self.reject)
 
         self._actions = actions or []
+        self._labels: List[str] = self._collect_labels(self._actions)
         self._populate()
 
+    @staticmethod
+    def _collect_labels(actions: List[Action]) -> List[str]:
+        return [a.target or a.id for a in actions if a.type == "label"]
+
+    def set_actions(self, actions: List[Action]) -> None:
+        """Point a reused dialog at the current timeline and clear the last input."""
+        self._actions = actions
+        self.input_label.clear()
+        labels = self._collect_labels(actions)
+        if labels != self._labels:
+            self._labels = labels
+            self._populate()
+
+    def add_label(self, name: str) -> None:
+        """Append one label row without rebuilding the list."""
+        self._labels.append(name)
+        row = self._model.rowCount()
+        self._model.insertRows(row, 1)
+        self._model.setData(self._model.index(row), name)
+
     def _populate(self) -> None:
-        self.list.clear()
-        for a in self._actions:
-            if a.type == "label":
-                self.list.addItem(a.target or a.id)
+        self._model.setStringList(self._labels)
 
     def new_label_action(self) -> Action | None:
         name = self.input_label.text().strip()
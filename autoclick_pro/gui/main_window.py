@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import copy
+import os
+from functools import lru_cache, wraps
 from pathlib import Path
+from typing import Any, Callable
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QAction
+from PySide6.QtCore import QObject, Qt, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtGui import QAction, QIcon, QPixmapCache
 from PySide6.QtWidgets import (
     QMainWindow,
     QSplitter,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QWidget,
     QVBoxLayout,
     QLabel,
@@ -17,60 +20,188 @@ from PySide6.QtWidgets import (
     QStatusBar,
     QPushButton,
     QStyle,
+    QListWidget,
+    QListWidgetItem,
+    QHBoxLayout,
+    QRadioButton,
+    QStackedWidget,
 )
 
 from autoclick_pro.logging.logger import get_logger
-from autoclick_pro.core.engine import Engine
 from autoclick_pro.gui.editor import MacroEditor
-from autoclick_pro.gui.capture import CaptureDialog
+from autoclick_pro.gui.project_tree import ProjectTreeModel
 from autoclick_pro.recorder.recorder import Recorder
 from autoclick_pro.data.model import Action, Macro, Project
 from autoclick_pro.persistence.project_io import save_project, load_project
 
 
+@lru_cache(maxsize=None)
+def _resolve_std_pixmap(candidates: tuple[str, ...]) -> tuple[str, QStyle.StandardPixmap]:
+    # First standard pixmap this Qt/PySide build provides, across version renames
+    for name in candidates:
+        sp = getattr(QStyle, name, None)
+        if sp is not None:
+            return name, sp
+    # last-resort generic icon
+    return "SP_MessageBoxInformation", QStyle.SP_MessageBoxInformation
+
+
+class _LazyPane(QStackedWidget):
+    """Holds a "Loading…" label in a pane until its real widget is built."""
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.addWidget(QLabel("Loading…", alignment=Qt.AlignmentFlag.AlignCenter))
+
+    def set_widget(self, widget: QWidget) -> None:
+        placeholder = self.widget(0)
+        self.addWidget(widget)
+        self.setCurrentWidget(widget)
+        self.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+
+# Coalescing window for engine status pings during playback
+_ENGINE_STATUS_MS = 50
+
+
+class _PoolWorker(QObject):
+    """
+    Runs one blocking call on the global QThreadPool. The worker object itself
+    lives on the UI thread, so done/error reach bound-method slots as queued
+    calls there. `busy` lists the actions/widgets disabled while it runs.
+    """
+    done = Signal(object)
+    error = Signal(str)
+
+    def __init__(self, fn: Callable[[], Any], busy: tuple = (), parent=None) -> None:
+        super().__init__(parent)
+        self._fn = fn
+        self.busy = busy
+
+    def start(self) -> None:
+        QThreadPool.globalInstance().start(self._run)
+
+    def _run(self) -> None:
+        try:
+            result = self._fn()
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.done.emit(result)
+
+
+# Detect inspector work, run on the thread pool; each returns
+# (screenshot, bbox, score, candidates) for _show_inspector
+def _inspect_template(target: str, conf: float):
+    from autoclick_pro.util.screen import grab_screen_array
+    from autoclick_pro.detect.template_matcher import match_template_array
+    import cv2
+
+    screen = grab_screen_array()
+    tmpl = cv2.imread(target, cv2.IMREAD_COLOR)
+    if tmpl is None:
+        return screen, None, 0.0, None
+    res = match_template_array(screen, tmpl, confidence_threshold=conf)
+    return screen, res.bbox, res.score, None
+
+
+def _inspect_features(target: str, conf: float):
+    from autoclick_pro.util.screen import grab_region_gray, primary_monitor
+    from autoclick_pro.detect.feature_matcher import FeatureMatchResult, feature_match_array, load_template_features
+    import cv2
+
+    # Feature matching is grayscale, so grab straight to gray and show the
+    # inspector exactly the frame that was matched
+    gray = grab_region_gray(*primary_monitor())
+    screen = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+    features = load_template_features(Path(target))
+    if features is None:
+        res = FeatureMatchResult([])
+    else:
+        res = feature_match_array(gray, features, confidence_threshold=conf)
+    cands = [(c.bbox, c.score) for c in res.candidates]
+    bbox, score = cands[0] if cands else (None, 0.0)
+    return screen, bbox, score, cands
+
+
+def _status_handler(event: str, status_fmt: str):
+    """
+    Wrap a MainWindow handler that returns log fields (or None when it did
+    nothing): log `event` with them and show `status_fmt` formatted from them.
+    """
+    def deco(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            payload = fn(self, *args, **kwargs)
+            if payload is None:
+                return
+            self.log.info(event, **payload)
+            self._set_status(status_fmt.format(**payload))
+        return wrapper
+    return deco
+
+
 class MainWindow(QMainWindow):
+    # Engine status arrives on the worker thread; the signal queues it onto the UI thread
+    engine_status = Signal(str)
+
+    # Fixed texts for the simulation toggle, indexed by its checked state
+    _SIM_LABEL = {True: "Simulation: ON", False: "Simulation: OFF"}
+    _SIM_STATUS = {True: "Simulation mode: ON", False: "Simulation mode: OFF"}
+
+    # kind -> (title, name filter, accept mode) for the reused file dialogs
+    _FILE_DIALOGS = {
+        "save": ("Save Project", "Project JSON (*.json)", QFileDialog.AcceptMode.AcceptSave),
+        "load": ("Open Project", "Project JSON (*.json)", QFileDialog.AcceptMode.AcceptOpen),
+        "export": ("Export", "Executable (*.exe);;All Files (*)", QFileDialog.AcceptMode.AcceptSave),
+    }
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("AutoClick Pro")
         self.resize(1200, 800)
         self.log = get_logger()
 
-        # Engine
-        self.engine = Engine()
-        self.engine.on_status(lambda s: self.statusBar().showMessage(s))
+        # The engine (and the OpenCV/numpy stack it imports) is created in
+        # _finish_init, after the window has been shown
+        self.engine_status.connect(self._on_engine_status)
 
         # Recorder
         self.recorder = Recorder()
         self.recording = False
 
+        # Child dialogs, built on first use and reused afterwards
+        self._keymap_editor = None
+        self._label_manager = None
+        self._file_dialogs: dict[str, QFileDialog] = {}
+
         # Toolbar
         tb = QToolBar("Main")
         tb.setMovable(False)
         # Show text beside icons to improve readability on dark backgrounds
         tb.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
         self.addToolBar(tb)
+        self._toolbar = tb
 
-        style = self.style()
+        # Icons are resolved on first show (see _apply_toolbar_icons); until
+        # then each action only records its standard-pixmap candidates
+        self._pending_icons: list[tuple[QAction, tuple[str, ...]]] = []
 
-        # Helper to resolve a standard icon with fallbacks across Qt/PySide versions
-        def std_icon(*candidates: str):
-            for name in candidates:
-                sp = getattr(QStyle, name, None)
-                if sp is not None:
-                    return style.standardIcon(sp)
-            # last-resort generic icon
-            return style.standardIcon(QStyle.SP_MessageBoxInformation)
+        def icon_action(text: str, *candidates: str) -> QAction:
+            action = QAction(text, self)
+            self._pending_icons.append((action, candidates))
+            return action
 
         # Qt does not provide a MediaRecord standard icon; use Apply/Yes/Ok as reasonable substitutes
-        self.action_record = QAction(std_icon("SP_DialogApplyButton", "SP_DialogYesButton", "SP_DialogOkButton"), "Record", self)
-        self.action_play = QAction(std_icon("SP_MediaPlay", "SP_ArrowForward"), "Play", self)
-        self.action_pause = QAction(std_icon("SP_MediaPause", "SP_MediaStop"), "Pause", self)
-        self.action_stop = QAction(std_icon("SP_MediaStop", "SP_BrowserStop"), "Stop", self)
-        self.action_estop = QAction(std_icon("SP_BrowserStop", "SP_MessageBoxCritical"), "E-Stop", self)
-        self.action_save = QAction(std_icon("SP_DialogSaveButton", "SP_DialogApplyButton"), "Save", self)
-        self.action_load = QAction(std_icon("SP_DialogOpenButton", "SP_DirOpenIcon" if hasattr(QStyle, "SP_DirOpenIcon") else "SP_DialogOpenButton"), "Load", self)
-        self.action_export = QAction(std_icon("SP_ComputerIcon", "SP_DriveHDIcon"), "Export", self)
-        self.action_capture = QAction(std_icon("SP_FileIcon", "SP_DialogOpenButton"), "Capture Object", self)
+        self.action_record = icon_action("Record", "SP_DialogApplyButton", "SP_DialogYesButton", "SP_DialogOkButton")
+        self.action_play = icon_action("Play", "SP_MediaPlay", "SP_ArrowForward")
+        self.action_pause = icon_action("Pause", "SP_MediaPause", "SP_MediaStop")
+        self.action_stop = icon_action("Stop", "SP_MediaStop", "SP_BrowserStop")
+        self.action_estop = icon_action("E-Stop", "SP_BrowserStop", "SP_MessageBoxCritical")
+        self.action_save = icon_action("Save", "SP_DialogSaveButton", "SP_DialogApplyButton")
+        self.action_load = icon_action("Load", "SP_DialogOpenButton", "SP_DirOpenIcon" if hasattr(QStyle, "SP_DirOpenIcon") else "SP_DialogOpenButton")
+        self.action_export = icon_action("Export", "SP_ComputerIcon", "SP_DriveHDIcon")
+        self.action_capture = icon_action("Capture Object", "SP_FileIcon", "SP_DialogOpenButton")
         self.action_simulation = QAction("Simulation", self)
         self.action_simulation.setCheckable(True)
         self.action_simulation.setChecked(True)
@@ -86,9 +217,9 @@ class MainWindow(QMainWindow):
         self.action_capture.setShortcut("Ctrl+Shift+C")
 
         # Keymap editor action
-        self.action_keymap = QAction(std_icon("SP_DirIcon", "SP_DirOpenIcon", "SP_DialogOpenButton"), "Keymap Editor", self)
+        self.action_keymap = icon_action("Keymap Editor", "SP_DirIcon", "SP_DirOpenIcon", "SP_DialogOpenButton")
         # Label manager action
-        self.action_label_manager = QAction(std_icon("SP_DialogYesButton", "SP_DialogOkButton", "SP_DialogApplyButton"), "Label Manager", self)
+        self.action_label_manager = icon_action("Label Manager", "SP_DialogYesButton", "SP_DialogOkButton", "SP_DialogApplyButton")
 
         for a in (
             self.action_record,
@@ -107,7 +238,7 @@ class MainWindow(QMainWindow):
             tb.addAction(a)
         tb.addSeparator()
         # Instructions/help
-        self.action_instructions = QAction(std_icon("SP_MessageBoxInformation", "SP_DialogHelpButton"), "Instructions", self)
+        self.action_instructions = icon_action("Instructions", "SP_MessageBoxInformation", "SP_DialogHelpButton")
         tb.addAction(self.action_instructions)
         tb.addSeparator()
         tb.addAction(self.action_simulation)
@@ -116,24 +247,18 @@ class MainWindow(QMainWindow):
         splitter = QSplitter(Qt.Horizontal, self)
 
         # Left: projects/macros tree
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Projects / Macros"])
-        demo = QTreeWidgetItem(["Sample Project"])
-        demo_macro = QTreeWidgetItem(["Hello Macro"])
-        demo.addChild(demo_macro)
-        self.tree.addTopLevelItem(demo)
-        self.tree.expandAll()
-
-        # Center: macro editor
-        self.editor = MacroEditor()
-        # Seed with a simple demo
-        self.editor.set_actions(
-            [
-                Action(id="a1", type="mouse_click", params={"x": None, "y": None, "button": "left"}),
-                Action(id="a2", type="wait", params={"ms": 500}),
-                Action(id="a3", type="key_sequence", params={"sequence": ["Hello from AutoClick Pro!", "ENTER"]}),
-            ]
-        )
+        self.tree_model = ProjectTreeModel(parent=self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.tree_model)
+        self.tree.setUniformRowHeights(True)
+
+        # Center: macro editor. It and the flow/graph views are built by
+        # _finish_init once the window is first shown; until then the panes
+        # hold placeholders.
+        self._editor_pane = _LazyPane()
+        self._flow_pane = _LazyPane()
+        self._graph_pane = _LazyPane()
+        self._init_done = False
 
         # Right: properties / utilities
         self.props = QWidget()
@@ -153,8 +278,8 @@ class MainWindow(QMainWindow):
 
         # Keymap list manager
         pv.addWidget(QLabel("Saved Keymaps"))
-        from PySide6.QtWidgets import QListWidget
         self.keymap_list = QListWidget()
+        self.keymap_list.setUniformItemSizes(True)
         pv.addWidget(self.keymap_list)
         self.btn_add_keymap = QPushButton("Add From Keymap Editor")
         pv.addWidget(self.btn_add_keymap)
@@ -164,28 +289,17 @@ class MainWindow(QMainWindow):
         pv.addStretch()
 
         splitter.addWidget(self.tree)
-        splitter.addWidget(self.editor)
-
-        # Flow view
-        from autoclick_pro.gui.flow_view import FlowView
-        self.flow = FlowView()
-        self.editor.actions_changed.connect(lambda: self.flow.render_actions(self.editor.actions()))
-        self.flow.render_actions(self.editor.actions())
+        splitter.addWidget(self._editor_pane)
 
         # Put flow view under utilities
         pv.addWidget(QLabel("Flow View"))
-        pv.addWidget(self.flow)
+        pv.addWidget(self._flow_pane)
 
         # Graph-based timeline editor
-        from autoclick_pro.gui.graph_editor import GraphEditor
         pv.addWidget(QLabel("Graph Editor (Double-click a node to link targets)"))
-        self.graph = GraphEditor()
-        pv.addWidget(self.graph)
-        self.graph.render_actions(self.editor.actions())
-        self.editor.actions_changed.connect(lambda: (self.flow.render_actions(self.editor.actions()), self.graph.render_actions(self.editor.actions())))
+        pv.addWidget(self._graph_pane)
 
         # Link mode for conditional jumps
-        from PySide6.QtWidgets import QHBoxLayout, QRadioButton
         link_row = QHBoxLayout()
         pv.addLayout(link_row)
         self.rb_true = QRadioButton("Link TRUE")
@@ -194,8 +308,6 @@ class MainWindow(QMainWindow):
         link_row.addWidget(self.rb_true)
         link_row.addWidget(self.rb_false)
 
-        self.graph.node_activated.connect(self.on_graph_node_activated)
-
         splitter.addWidget(self.props)
         splitter.setStretchFactor(0, 1)
         splitter.setStretchFactor(1, 2)
@@ -206,20 +318,77 @@ class MainWindow(QMainWindow):
         # Status bar
         sb = QStatusBar()
         self.setStatusBar(sb)
-        sb.showMessage("Ready")
-        self.sim_label = QLabel("Simulation: ON")
+        sb.showMessage("Loading...")
+        self._sb = sb
+        # Bursts of status messages collapse into one repaint on the next event-loop pass
+        self._pending_status: str | None = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._flush_status)
+        self.sim_label = QLabel(self._SIM_LABEL[self.action_simulation.isChecked()])
         sb.addPermanentWidget(self.sim_label)
 
-        # Wire actions
+        # Only the simulation toggle is wired here; every other action and button
+        # reaches the editor or engine, so _finish_init connects them once those exist
+        self.action_simulation.toggled.connect(self.on_simulation_toggled)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._pending_icons:
+            self._apply_toolbar_icons()
+        if not self._init_done:
+            self._init_done = True
+            QTimer.singleShot(0, self._finish_init)
+
+    def _apply_toolbar_icons(self) -> None:
+        # Toolbar icons are rasterized once at toolbar size and kept in
+        # QPixmapCache, so repaints blit a pixmap instead of re-rendering the
+        # style's icon engine; actions sharing a standard pixmap share one QIcon
+        style = self.style()
+        icon_size = self._toolbar.iconSize()
+        dpr = self.devicePixelRatioF()
+        icons: dict[str, QIcon] = {}
+        for action, candidates in self._pending_icons:
+            name, sp = _resolve_std_pixmap(candidates)
+            icon = icons.get(name)
+            if icon is None:
+                key = f"std_icon:{name}:{icon_size.width()}x{icon_size.height()}@{dpr}"
+                pm = QPixmapCache.find(key)
+                if pm is None:
+                    pm = style.standardIcon(sp).pixmap(icon_size, dpr)
+                    QPixmapCache.insert(key, pm)
+                icon = icons[name] = QIcon(pm)
+            action.setIcon(icon)
+        self._pending_icons.clear()
+
+    def _finish_init(self) -> None:
+        # Runs on the first event-loop pass after show, so the shell paints before
+        # the engine imports, the editor and the two graphics scenes are built
+        from autoclick_pro.core.engine import Engine
+        from autoclick_pro.gui.flow_view import FlowView
+        from autoclick_pro.gui.graph_editor import GraphEditor
+
+        self.engine = Engine()
+        self.engine.on_status(self.engine_status.emit)
+
+        self.editor = MacroEditor()
+        self.flow = FlowView()
+        self.graph = GraphEditor()
+        self._editor_pane.set_widget(self.editor)
+        self._flow_pane.set_widget(self.flow)
+        self._graph_pane.set_widget(self.graph)
+        self.editor.actions_changed.connect(self._on_actions_changed)
+        self.graph.node_activated.connect(self.on_graph_node_activated)
+
+        # Wire actions; until now shortcuts and buttons had nothing to reach
         self.action_record.triggered.connect(self.on_record)
         self.action_play.triggered.connect(self.on_play)
-        self.action_pause.triggered.connect(lambda: self.engine.pause())
-        self.action_stop.triggered.connect(lambda: self.engine.stop())
-        self.action_estop.triggered.connect(lambda: self.engine.estop())
+        self.action_pause.triggered.connect(self.engine.pause)
+        self.action_stop.triggered.connect(self.engine.stop)
+        self.action_estop.triggered.connect(self.engine.estop)
         self.action_save.triggered.connect(self.on_save)
         self.action_load.triggered.connect(self.on_load)
         self.action_export.triggered.connect(self.on_export)
-        self.action_simulation.toggled.connect(self.on_simulation_toggled)
         self.action_capture.triggered.connect(self.on_capture)
         self.action_keymap.triggered.connect(self.on_keymap)
         self.action_label_manager.triggered.connect(self.on_label_manager)
@@ -229,6 +398,55 @@ class MainWindow(QMainWindow):
         self.btn_loop_test.clicked.connect(self.on_loop_test)
         self.btn_add_keymap.clicked.connect(self.on_keymap_add_to_list)
         self.btn_insert_keymap.clicked.connect(self.on_keymap_insert_selected)
+        # Normal launches start empty; AUTOCLICK_DEMO=1 seeds the sample project
+        if os.environ.get("AUTOCLICK_DEMO") == "1":
+            self._populate_demo()
+        self._set_status("Ready")
+
+    def _on_actions_changed(self) -> None:
+        actions = self.editor.actions()
+        self.flow.render_actions(actions)
+        self.graph.render_actions(actions)
+
+    def _populate_demo(self) -> None:
+        # Sample project; the views render it once through actions_changed
+        self._populate_tree([("Sample Project", ["Hello Macro"])])
+        self.editor.set_actions(
+            [
+                Action(id="a1", type="mouse_click", params={"x": None, "y": None, "button": "left"}),
+                Action(id="a2", type="wait", params={"ms": 500}),
+                Action(id="a3", type="key_sequence", params={"sequence": ["Hello from AutoClick Pro!", "ENTER"]}),
+            ]
+        )
+
+    def _populate_tree(self, projects) -> None:
+        """Rebuild the projects tree in one model reset, with repaints held off."""
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree_model.set_projects(projects)
+            # Only the first project opens; the view lays out other projects'
+            # macros when the user expands them
+            first = self.tree_model.index(0, 0)
+            if first.isValid():
+                self.tree.setExpanded(first, True)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+    def _set_status(self, msg: str, delay_ms: int = 0) -> None:
+        self._pending_status = msg
+        if not self._status_timer.isActive():
+            self._status_timer.start(delay_ms)
+
+    def _flush_status(self) -> None:
+        if self._pending_status is not None:
+            self._sb.showMessage(self._pending_status)
+            self._pending_status = None
+
+    @Slot(str)
+    def _on_engine_status(self, msg: str) -> None:
+        # Playback can report faster than the eye can read; show the latest
+        # engine status at most once per interval
+        self._set_status(msg, _ENGINE_STATUS_MS)
 
     # Action handlers
     def on_record(self):
@@ -236,159 +454,202 @@ class MainWindow(QMainWindow):
             self.recorder.start()
             self.recording = True
             self.log.info("record_started")
-            self.statusBar().showMessage("Recording... (click Record again to stop)")
+            self._set_status("Recording... (click Record again to stop)")
             self.action_record.setText("Stop Recording")
         else:
             actions = self.recorder.stop()
             self.recording = False
             self.action_record.setText("Record")
             self.log.info("record_finished", count=len(actions))
-            self.statusBar().showMessage(f"Recorded {len(actions)} actions")
+            self._set_status(f"Recorded {len(actions)} actions")
             # Append recorded actions to editor
-            existing = self.editor.actions()
-            self.editor.set_actions(existing + actions)
+            self.editor.append_actions(actions)
 
+    @_status_handler("play_clicked", "Playing macro (simulation={simulation})...")
     def on_play(self):
         sim = self.action_simulation.isChecked()
-        self.log.info("play_clicked", simulation=sim)
         self.engine.set_simulation(sim)
-        self.statusBar().showMessage("Playing macro (simulation=%s)..." % sim)
-
-        # Build action dicts from editor
-        acts = []
-        for a in self.editor.actions():
-            acts.append(
-                {
-                    "id": a.id,
-                    "type": a.type,
-                    "target": a.target,
-                    "params": a.params,
-                    "delay_before_ms": a.delay_before_ms,
-                    "delay_after_ms": a.delay_after_ms,
-                    "repeat_count": a.repeat_count,
-                }
-            )
-        self.engine.start(acts)
+
+        self.engine.start([a.to_dict() for a in self.editor.actions()])
+        return {"simulation": sim}
+
+    def _file_dialog(self, kind: str, on_selected) -> QFileDialog:
+        # One dialog per purpose, built on first use and reopened afterwards
+        dlg = self._file_dialogs.get(kind)
+        if dlg is None:
+            title, name_filter, mode = self._FILE_DIALOGS[kind]
+            dlg = QFileDialog(self, title)
+            dlg.setAcceptMode(mode)
+            dlg.setNameFilter(name_filter)
+            if mode == QFileDialog.AcceptMode.AcceptOpen:
+                dlg.setFileMode(QFileDialog.FileMode.ExistingFile)
+            dlg.setOption(QFileDialog.Option.DontResolveSymlinks, True)
+            dlg.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons, True)
+            dlg.fileSelected.connect(on_selected)
+            self._file_dialogs[kind] = dlg
+        return dlg
 
     def on_save(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Save Project", filter="Project JSON (*.json)")
+        self._file_dialog("save", self._on_save_selected).open()
+
+    def _on_save_selected(self, path: str):
         if not path:
             return
+        # Snapshot the timeline so edits made during the write cannot race it
         proj = Project(
             name="Project",
-            macros=[Macro(id="m1", name="Macro 1", timeline=self.editor.actions())],
+            macros=[Macro(id="m1", name="Macro 1", timeline=copy.deepcopy(self.editor.actions()))],
             objects=[],
         )
-        save_project(Path(path), proj)
-        self.log.info("project_saved", path=path)
-        self.statusBar().showMessage(f"Saved to {path}")
+
+        def write() -> str:
+            save_project(Path(path), proj)
+            return path
+
+        self._run_io(write, self._on_project_saved)
+
+    @_status_handler("project_saved", "Saved to {path}")
+    def _on_project_saved(self, path: str):
+        return {"path": path}
 
     def on_load(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Open Project", filter="Project JSON (*.json)")
-        if not path:
-            return
-        proj = load_project(Path(path))
+        self._file_dialog("load", self._on_load_selected).open()
+
+    def _on_load_selected(self, path: str):
+        if path:
+            self._run_io(lambda: (path, load_project(Path(path))), self._on_project_loaded)
+
+    @_status_handler("project_loaded", "Loaded {path}")
+    def _on_project_loaded(self, result: tuple[str, Project]):
+        path, proj = result
         actions = proj.macros[0].timeline if proj.macros else []
+        self._populate_tree([(proj.name, [m.name for m in proj.macros])])
         self.editor.set_actions(actions)
-        self.log.info("project_loaded", path=path, actions=len(actions))
-        self.statusBar().showMessage(f"Loaded {path}")
+        return {"path": path, "actions": len(actions)}
+
+    def _run_in_pool(self, fn: Callable[[], Any], on_done, on_error, busy: tuple) -> None:
+        # Blocking work runs off the UI thread; `busy` stays disabled until it finishes
+        for w in busy:
+            w.setEnabled(False)
+        worker = _PoolWorker(fn, busy, self)
+        worker.done.connect(on_done)
+        worker.error.connect(on_error)
+        worker.done.connect(self._on_pool_finished)
+        worker.error.connect(self._on_pool_finished)
+        worker.start()
+
+    def _on_pool_finished(self, *_) -> None:
+        worker = self.sender()
+        for w in worker.busy:
+            w.setEnabled(True)
+        worker.deleteLater()
+
+    def _run_io(self, fn: Callable[[], Any], on_done) -> None:
+        self._run_in_pool(fn, on_done, self._on_io_error, (self.action_save, self.action_load))
+
+    def _on_io_error(self, msg: str) -> None:
+        self.log.warning("project_io_failed", error=msg)
+        self._set_status(f"File operation failed: {msg}")
 
     def on_export(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Export", filter="Executable (*.exe);;All Files (*)")
+        self._file_dialog("export", self._on_export_selected).open()
+
+    @_status_handler("export_clicked", "Export target set to {path}")
+    def _on_export_selected(self, path: str):
         if path:
-            self.log.info("export_clicked", path=path)
-            self.statusBar().showMessage(f"Export target set to {path}")
+            return {"path": path}
 
+    def _get_keymap_editor(self):
+        # Built once and reused; the key grid is the expensive part
+        if self._keymap_editor is None:
+            from autoclick_pro.gui.keymap_editor import KeymapEditor
+            self._keymap_editor = KeymapEditor(self)
+        else:
+            self._keymap_editor.reset()
+        return self._keymap_editor
+
+    def _get_label_manager(self):
+        if self._label_manager is None:
+            from autoclick_pro.gui.label_manager import LabelManager
+            self._label_manager = LabelManager(self, actions=self.editor.actions())
+        else:
+            self._label_manager.set_actions(self.editor.actions())
+        return self._label_manager
+
+    @_status_handler("keymap_added_action", "Keymap action added")
     def on_keymap(self):
-        from autoclick_pro.gui.keymap_editor import KeymapEditor
-        dlg = KeymapEditor(self)
+        dlg = self._get_keymap_editor()
         if dlg.exec():
             act = dlg.result_action()
             if act:
                 # Append as Action object
-                from autoclick_pro.data.model import Action as ActionModel
-                a = ActionModel(id=f"a{len(self.editor.actions())+1}", type=act["type"], target=None, params=act.get("params", {}))
-                actions = self.editor.actions()
-                actions.append(a)
-                self.editor.set_actions(actions)
-                self.flow.render_actions(actions)
-                self.graph.render_actions(actions)
-                self.log.info("keymap_added_action", params=act.get("params"))
-                self.statusBar().showMessage("Keymap action added")
+                a = Action(id=f"a{self.editor.model.rowCount()+1}", type=act["type"], target=None, params=act.get("params", {}))
+                self.editor.append_action(a)
+                return {"params": act.get("params")}
 
     def on_simulation_toggled(self, checked: bool):
         self.log.info("simulation_mode_toggled", checked=checked)
-        self.sim_label.setText(f"Simulation: {'ON' if checked else 'OFF'}")
-        self.statusBar().showMessage(f"Simulation mode: {'ON' if checked else 'OFF'}")
+        self.sim_label.setText(self._SIM_LABEL[checked])
+        self._set_status(self._SIM_STATUS[checked])
 
+    @_status_handler("capture_added_detect", "Captured template: {path}")
     def on_capture(self):
+        from autoclick_pro.gui.capture import CaptureDialog
         dlg = CaptureDialog(self, templates_dir=Path("templates"))
         if dlg.exec():
             tmpl_path = getattr(dlg, "selected_path", None)
             if tmpl_path:
                 # Add a detect action pointing to captured template
-                actions = self.editor.actions()
-                actions.append(Action(id=f"a{len(actions)+1}", type="detect", target=str(tmpl_path), params={"conf": 0.85}))
-                self.editor.set_actions(actions)
-                self.log.info("capture_added_detect", path=str(tmpl_path))
-                self.statusBar().showMessage(f"Captured template: {tmpl_path}")
+                self.editor.append_action(Action(id=f"a{self.editor.model.rowCount()+1}", type="detect", target=str(tmpl_path), params={"conf": 0.85}))
+                return {"path": str(tmpl_path)}
 
     def on_detect_demo(self):
         # Visual inspector for first detect action (template)
-        from autoclick_pro.util.screen import grab_screen
-        from autoclick_pro.detect.template_matcher import match_template
-        from autoclick_pro.gui.detect_inspector import DetectInspector
-
-        for a in self.editor.actions():
-            if a.type == "detect":
-                screen = grab_screen()
-                conf = float(a.params.get("conf", 0.85))
-                res = match_template(Path(screen), Path(str(a.target)), confidence_threshold=conf)
-                dlg = DetectInspector(self, screenshot_path=Path(screen), bbox=res.bbox, score=res.score)
-                dlg.exec()
-                break
+        a = self.editor.first_of_type("detect")
+        if a is not None:
+            target, conf = str(a.target), float(a.params.get("conf", 0.85))
+            self._run_detect(lambda: _inspect_template(target, conf))
 
     def on_detect_feature(self):
         # Visual inspector for first detect action using feature matching
-        from autoclick_pro.util.screen import grab_screen
-        from autoclick_pro.detect.feature_matcher import feature_match
+        a = self.editor.first_of_type("detect")
+        if a is not None:
+            target, conf = str(a.target), float(a.params.get("conf", 0.5))
+            self._run_detect(lambda: _inspect_features(target, conf))
+
+    def _run_detect(self, fn: Callable[[], Any]) -> None:
+        # Screen capture and matching run in the pool; the inspector opens on the UI thread
+        self._set_status("Detecting...")
+        self._run_in_pool(fn, self._show_inspector, self._on_detect_error, (self.btn_detect_demo, self.btn_detect_feature))
+
+    def _show_inspector(self, result) -> None:
         from autoclick_pro.gui.detect_inspector import DetectInspector
+        screen, bbox, score, cands = result
+        self._set_status("Ready")
+        dlg = DetectInspector(self, screenshot=screen, bbox=bbox, score=score, candidates=cands)
+        dlg.exec()
 
-        for a in self.editor.actions():
-            if a.type == "detect":
-                screen = grab_screen()
-                conf = float(a.params.get("conf", 0.5))
-                res = feature_match(Path(screen), Path(str(a.target)), confidence_threshold=conf)
-                cands = [ (c.bbox, c.score) for c in res.candidates ]
-                first = cands[0] if cands else ((None), 0.0)
-                bbox = first[0] if cands else None
-                score = first[1] if cands else 0.0
-                dlg = DetectInspector(self, screenshot_path=Path(screen), bbox=bbox, score=score, candidates=cands)
-                dlg.exec()
-                break
+    def _on_detect_error(self, msg: str) -> None:
+        self.log.warning("detect_inspect_failed", error=msg)
+        self._set_status(f"Detection failed: {msg}")
 
     def on_label_manager(self):
-        from autoclick_pro.gui.label_manager import LabelManager
-        dlg = LabelManager(self, actions=self.editor.actions())
+        dlg = self._get_label_manager()
         if dlg.exec():
             new_label = dlg.new_label_action()
             if new_label:
-                actions = self.editor.actions()
-                actions.append(new_label)
-                self.editor.set_actions(actions)
-                self.flow.render_actions(actions)
-                self.graph.render_actions(actions)
-                self.statusBar().showMessage(f"Label '{new_label.target}' added")
+                self.editor.append_action(new_label)
+                dlg.add_label(new_label.target)
+                self._set_status(f"Label '{new_label.target}' added")
 
     def on_graph_node_activated(self, target_id: str):
         # Link selected node to current conditional jump
-        item = self.editor.timeline.currentItem()
-        if not item:
-            self.statusBar().showMessage("Select a conditional_jump action in the editor first.")
+        a = self.editor.current_action()
+        if a is None:
+            self._set_status("Select a conditional_jump action in the editor first.")
             return
-        a = item.data(Qt.ItemDataRole.UserRole)
-        if not a or a.type != "conditional_jump":
-            self.statusBar().showMessage("Current selection is not a conditional_jump.")
+        if a.type != "conditional_jump":
+            self._set_status("Current selection is not a conditional_jump.")
             return
         params = dict(a.params or {})
         if self.rb_true.isChecked():
@@ -396,11 +657,8 @@ class MainWindow(QMainWindow):
         else:
             params["false_target"] = target_id
         a.params = params
-        item.setData(Qt.ItemDataRole.UserRole, a)
-        item.setText(self.editor._format_action(a))
-        self.flow.render_actions(self.editor.actions())
-        self.graph.render_actions(self.editor.actions())
-        self.statusBar().showMessage(f"Linked conditional to {target_id} ({'true' if self.rb_true.isChecked() else 'false'})")
+        self.editor.refresh_current()
+        self._set_status(f"Linked conditional to {target_id} ({'true' if self.rb_true.isChecked() else 'false'})")
 
     def on_loop_test(self):
         # Build a demo macro: label -> detect -> conditional_jump -> loop_until
@@ -415,19 +673,17 @@ class MainWindow(QMainWindow):
         self.engine.start(actions)
 
     def _first_detect_target(self) -> str | None:
-        for a in self.editor.actions():
-            if a.type == "detect" and a.target:
+        for a in self.editor.model.actions_of_type("detect"):
+            if a.target:
                 return str(a.target)
         return None
 
     def on_keymap_add_to_list(self):
         # Use keymap editor to create and store an action in the list
-        from autoclick_pro.gui.keymap_editor import KeymapEditor
-        dlg = KeymapEditor(self)
+        dlg = self._get_keymap_editor()
         if dlg.exec():
             act = dlg.result_action()
             if act:
-                from PySide6.QtWidgets import QListWidgetItem
                 item = QListWidgetItem(str(act.get("params")))
                 item.setData(Qt.ItemDataRole.UserRole, act)
                 self.keymap_list.addItem(item)
@@ -438,14 +694,9 @@ class MainWindow(QMainWindow):
         if not item:
             return
         act = item.data(Qt.ItemDataRole.UserRole)
-        from autoclick_pro.data.model import Action as ActionModel
-        a = ActionModel(id=f"a{len(self.editor.actions())+1}", type=act["type"], target=None, params=act.get("params", {}))
-        actions = self.editor.actions()
-        actions.append(a)
-        self.editor.set_actions(actions)
-        self.flow.render_actions(actions)
-        self.graph.render_actions(actions)
-        self.statusBar().showMessage("Inserted keymap action into macro")
+        a = Action(id=f"a{self.editor.model.rowCount()+1}", type=act["type"], target=None, params=act.get("params", {}))
+        self.editor.append_action(a)
+        self._set_status("Inserted keymap action into macro")
 
     def on_instructions(self):
         # Open instructions/help dialog
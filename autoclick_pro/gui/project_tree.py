@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QPersistentModelIndex, Qt
+
+
+@dataclass(slots=True)
+class _Node:
+    label: str
+    parent: int  # index into the node list, -1 for top level
+    row: int  # position among its parent's children
+    children: List[int] = field(default_factory=list)
+
+
+class ProjectTreeModel(QAbstractItemModel):
+    """
+    Read-only projects/macros tree kept as one flat node list. Model indexes
+    carry the node's list position as their internal id, so index() and
+    parent() are integer lookups rather than walks over item objects.
+    """
+    def __init__(self, header: str = "Projects / Macros", parent=None) -> None:
+        super().__init__(parent)
+        self._header = header
+        self._nodes: List[_Node] = []
+        self._top: List[int] = []
+
+    def set_projects(self, projects: Sequence[Tuple[str, Sequence[str]]]) -> None:
+        """Replace the tree with (project name, macro names) pairs."""
+        self.beginResetModel()
+        self._nodes = []
+        self._top = []
+        for p_row, (name, macros) in enumerate(projects):
+            p = len(self._nodes)
+            self._nodes.append(_Node(name, -1, p_row))
+            self._top.append(p)
+            for m_row, macro in enumerate(macros):
+                self._nodes[p].children.append(len(self._nodes))
+                self._nodes.append(_Node(macro, p, m_row))
+        self.endResetModel()
+
+    def _children(self, parent: QModelIndex | QPersistentModelIndex) -> List[int]:
+        return self._nodes[parent.internalId()].children if parent.isValid() else self._top
+
+    def index(self, row: int, column: int, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> QModelIndex:
+        children = self._children(parent)
+        if column != 0 or not 0 <= row < len(children):
+            return QModelIndex()
+        return self.createIndex(row, 0, children[row])
+
+    def parent(self, index: QModelIndex | QPersistentModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        p = self._nodes[index.internalId()].parent
+        if p < 0:
+            return QModelIndex()
+        return self.createIndex(self._nodes[p].row, 0, p)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._children(parent))
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
+            return self._nodes[index.internalId()].label
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Optional[str]:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole and section == 0:
+            return self._header
+        return None
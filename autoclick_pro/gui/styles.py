@@ -1,3 +1,5 @@
+import re
+
 DARK_QSS = """
 QWidget {
     background-color: #1e1f22;
@@ -31,16 +33,16 @@ QSplitter::handle {
     background: #2a2c30;
 }
 
-QTreeWidget, QListWidget {
+QTreeView, QListView {
     background: #232428;
     border: 1px solid #34363b;
     padding: 4px;
 }
-QTreeWidget::item:selected, QListWidget::item:selected {
+QTreeView::item:selected, QListView::item:selected {
     background: #334155;
     color: #e0e0e0;
 }
-QListWidget::item {
+QListView::item {
     padding: 6px;
 }
 
@@ -78,4 +80,7 @@ QStatusBar {
     background: #24262a;
     border-top: 1px solid #34363b;
 }
-"""
\ No newline at end of file
+"""
+
+# Single-line form handed to setStyleSheet: comments stripped, whitespace collapsed
+DARK_QSS_MIN = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", DARK_QSS, flags=re.S)).strip()
@@ -6,16 +6,20 @@ from typing import Iterable
 import pyautogui
 from pynput.keyboard import Controller, Key
 
+# Key names resolved once instead of getattr(Key, ...) per key press
+_KEY_MAP: dict[str, Key] = dict(Key.__members__)
+# Only these are pressed as keys inside a typed sequence; anything else is text
+_SEQUENCE_KEYS: dict[str, Key] = {name: _KEY_MAP[name] for name in ("enter", "tab", "esc")}
+
 
 class Mouse:
     def __init__(self) -> None:
         # pyautogui failsafe can be disabled if desired; keep enabled by default
         pyautogui.FAILSAFE = True
 
-    def click(self, x: int | None, y: int | None, button: str = "left") -> None:
-        if x is not None and y is not None:
-            pyautogui.moveTo(x, y, duration=0.0)
-        pyautogui.click(button=button)
+    def click(self, x: int | None, y: int | None, button: str = "left", clicks: int = 1, interval: float = 0.0) -> None:
+        # One call moves and clicks; with x/y None pyautogui clicks where the cursor is
+        pyautogui.click(x=x, y=y, button=button, clicks=clicks, interval=interval)
 
     def move(self, x: int, y: int, duration: float = 0.0) -> None:
         pyautogui.moveTo(x, y, duration=duration)
@@ -31,8 +35,8 @@ class Keyboard:
     def type_text_sequence(self, sequence: Iterable[str], delay_ms: int = 0) -> None:
         d = max(0, delay_ms) / 1000.0
         for item in sequence:
-            if item.upper() in {"ENTER", "TAB", "ESC"}:
-                key = getattr(Key, item.lower())
+            key = _SEQUENCE_KEYS.get(item.lower())
+            if key is not None:
                 self._ctl.press(key)
                 self._ctl.release(key)
             else:
@@ -45,13 +49,7 @@ class Keyboard:
         """
         Press keys as a chord, e.g. ["ctrl", "shift", "s"]
         """
-        resolved: list[Key | str] = []
-        for k in keys:
-            lk = k.lower()
-            try:
-                resolved.append(getattr(Key, lk))
-            except AttributeError:
-                resolved.append(k)
+        resolved: list[Key | str] = [_KEY_MAP.get(k.lower(), k) for k in keys]
 
         for k in resolved:
             self._ctl.press(k)
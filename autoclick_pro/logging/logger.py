@@ -1,7 +1,102 @@
+import queue
+import sys
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from loguru import logger
 
 
+class _BatchedFileSink:
+    """
+    JSON-lines file sink whose writes only queue the record. A writer thread
+    drains the queue in batches of up to `batch` lines, appends each batch with
+    one write+flush, and rotates the file once it passes `max_bytes`. Rotated
+    files are zipped (keeping the newest `retention` archives) on a separate
+    worker so compression never holds up the writer.
+    loguru calls stop() on logger.remove() (and at exit), which drains the queue.
+    """
+    def __init__(self, path: Path, max_bytes: int, retention: int, batch: int = 256, interval_s: float = 0.25) -> None:
+        self._path = path
+        self._max_bytes = max_bytes
+        self._retention = retention
+        self._batch = batch
+        self._interval_s = interval_s
+        self._queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._archiver = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-archive")
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        self._queue.put(message)
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        self._archiver.shutdown(wait=True)
+
+    def _run(self) -> None:
+        f = open(self._path, "ab")
+        size = f.tell()
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self._interval_s)
+            except queue.Empty:
+                continue
+            batch: list[str] = []
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self._batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if not batch:
+                continue
+            data = "".join(batch).encode("utf-8")
+            try:
+                if size and size + len(data) > self._max_bytes:
+                    f.close()
+                    self._rotate()
+                    f = open(self._path, "ab")
+                    size = 0
+                f.write(data)
+                f.flush()
+                size += len(data)
+            except OSError as e:
+                print(f"log write failed: {e}", file=sys.stderr)
+        f.close()
+
+    def _rotate(self) -> None:
+        # Same naming as loguru's own rotation: app.<timestamp>.jsonl(.zip)
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        rotated = self._path.with_name(f"{self._path.stem}.{stamp}{self._path.suffix}")
+        self._path.rename(rotated)
+        self._archiver.submit(self._archive, rotated)
+
+    def _archive(self, rotated: Path) -> None:
+        try:
+            self._compress(rotated)
+        except OSError as e:
+            print(f"log archive failed: {e}", file=sys.stderr)
+            return
+        archives = sorted(self._path.parent.glob(f"{self._path.stem}.*{self._path.suffix}.zip"))
+        for old in archives[:-self._retention]:
+            old.unlink(missing_ok=True)
+
+    @staticmethod
+    def _compress(path: Path) -> None:
+        with zipfile.ZipFile(f"{path}.zip", "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.write(path, path.name)
+        path.unlink()
+
+
 def configure_logging(log_dir: Path | None = None) -> None:
     """
     Configure loguru to write structured JSON logs to logs/app.jsonl
@@ -22,15 +117,11 @@ def configure_logging(log_dir: Path | None = None) -> None:
         diagnose=False,
     )
 
-    # JSON structured log sink
+    # JSON structured log sink; the sink does its own queueing, so no enqueue
     json_path = log_dir / "app.jsonl"
     logger.add(
-        str(json_path),
+        _BatchedFileSink(json_path, max_bytes=10 * 1024 * 1024, retention=10),
         level="DEBUG",
-        enqueue=True,
-        rotation="10 MB",
-        retention=10,
-        compression="zip",
         serialize=True,  # JSON lines
     )
 
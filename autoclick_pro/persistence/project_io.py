@@ -1,30 +1,55 @@
 from __future__ import annotations
 
+import gzip
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from autoclick_pro.data.model import Action, Macro, Project
 
+# orjson is optional; the stdlib module produces the same files, just slower
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional too; with it, load_project streams files past this size instead of
+# parsing them whole. Below it a one-shot parse is faster and the memory is negligible.
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+_STREAM_MIN_BYTES = 32 * 1024 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _dumps(data: Any, pretty: bool) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
-def save_project(path: Path, project: Project) -> None:
-    def ser_action(a: Action) -> dict[str, Any]:
-        return {
-            "id": a.id,
-            "type": a.type,
-            "target": a.target,
-            "params": a.params,
-            "delay_before_ms": a.delay_before_ms,
-            "delay_after_ms": a.delay_after_ms,
-            "repeat_count": a.repeat_count,
-        }
 
+def save_project(path: Path, project: Project, *, pretty: bool = False, gzip_level: int | None = None) -> None:
+    """
+    Write a project as compact JSON, or indented with `pretty` for hand-reading.
+    With `gzip_level` the file is gzip-compressed; load_project detects that itself.
+    """
     def ser_macro(m: Macro) -> dict[str, Any]:
         return {
             "id": m.id,
             "name": m.name,
             "description": m.description,
-            "timeline": [ser_action(a) for a in m.timeline],
+            "timeline": [a.to_dict() for a in m.timeline],
             "triggers": m.triggers,
         }
 
@@ -38,28 +63,64 @@ def save_project(path: Path, project: Project) -> None:
         "metadata": project.metadata,
     }
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    buf = _dumps(data, pretty)
+    if gzip_level is not None:
+        buf = gzip.compress(buf, compresslevel=gzip_level)
+    path.write_bytes(buf)
 
 
-def load_project(path: Path) -> Project:
-    raw = json.loads(path.read_text(encoding="utf-8"))
+def _macro_from_raw(m: dict[str, Any]) -> Macro:
+    from_dict = Action.from_dict
+    acts = [from_dict(a) for a in m.get("timeline", [])]
+    return Macro(id=str(m.get("id", "")), name=str(m.get("name", "")), description=str(m.get("description", "")), timeline=acts, triggers=m.get("triggers", []))
+
+
+def _open_project(path: Path) -> BinaryIO:
+    f = path.open("rb")
+    if f.read(2) == _GZIP_MAGIC:
+        f.close()
+        return gzip.open(path, "rb")
+    f.seek(0)
+    return f
+
 
+def _stream_project(path: Path) -> tuple[dict[str, Any], list[Macro]]:
+    """
+    Single ijson pass over a project file. Each macro becomes a Macro as soon as
+    its object closes, so the raw dict tree of the whole file is never held at once.
+    Returns the remaining top-level keys and the macros.
+    """
+    raw: dict[str, Any] = {}
     macros: list[Macro] = []
-    for m in raw.get("macros", []):
-        acts: list[Action] = []
-        for a in m.get("timeline", []):
-            acts.append(
-                Action(
-                    id=str(a.get("id", "")),
-                    type=str(a.get("type", "")),
-                    target=a.get("target"),
-                    params=a.get("params", {}),
-                    delay_before_ms=int(a.get("delay_before_ms", 0)),
-                    delay_after_ms=int(a.get("delay_after_ms", 0)),
-                    repeat_count=int(a.get("repeat_count", 1)),
-                )
-            )
-        macros.append(Macro(id=str(m.get("id", "")), name=str(m.get("name", "")), description=str(m.get("description", "")), timeline=acts, triggers=m.get("triggers", [])))
+    key = ""
+    builder: ObjectBuilder | None = None
+    with _open_project(path) as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is None:
+                # Top-level map and the macros array are structure, not values
+                if prefix in ("", "macros"):
+                    continue
+                builder = ObjectBuilder()
+                key = prefix
+            builder.event(event, value)
+            if prefix == key and event not in ("start_map", "start_array", "map_key"):
+                if key == "macros.item":
+                    macros.append(_macro_from_raw(builder.value))
+                else:
+                    raw[key] = builder.value
+                builder = None
+    return raw, macros
+
+
+def load_project(path: Path) -> Project:
+    if ijson is not None and path.stat().st_size >= _STREAM_MIN_BYTES:
+        raw, macros = _stream_project(path)
+    else:
+        buf = path.read_bytes()
+        if buf[:2] == _GZIP_MAGIC:
+            buf = gzip.decompress(buf)
+        raw = _loads(buf)
+        macros = [_macro_from_raw(m) for m in raw.get("macros", [])]
 
     return Project(
         name=str(raw.get("name", "Project")),
@@ -69,4 +130,4 @@ def load_project(path: Path) -> Project:
         objects=raw.get("objects", []),
         global_settings=raw.get("global_settings", {"default_confidence": 0.85, "anti_detection": False}),
         metadata=raw.get("metadata", {}),
-    )
\ No newline at end of file
+    )
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-import threading
+import itertools
 import time
-from typing import List, Optional
+from collections import deque
+from typing import Deque, List, Optional
 
 from pynput import mouse, keyboard
 
 from autoclick_pro.data.model import Action
 from autoclick_pro.logging.logger import get_logger
 
+# Recorded names precomputed per enum member, in the same form str() produced
+_BUTTON_NAMES: dict[mouse.Button, str] = {b: b.name for b in mouse.Button}
+_KEY_NAMES: dict[keyboard.Key, str] = {k: str(k) for k in keyboard.Key}
+
 
 class Recorder:
     """
@@ -19,15 +24,18 @@ class Recorder:
         self._mouse_listener: Optional[mouse.Listener] = None
         self._key_listener: Optional[keyboard.Listener] = None
         self._running = False
-        self._start_ts = 0.0
-        self._actions: List[Action] = []
-        self._lock = threading.Lock()
+        self._start_ns = 0
+        # Appended from the pynput listener threads without a lock: deque.append
+        # and next() on a count are atomic, so the callbacks return straight away
+        self._actions: Deque[Action] = deque()
+        self._ids = itertools.count(1)
 
     def start(self) -> None:
         if self._running:
             return
         self._actions.clear()
-        self._start_ts = time.time()
+        self._ids = itertools.count(1)
+        self._start_ns = time.monotonic_ns()
         self._running = True
 
         self._mouse_listener = mouse.Listener(on_click=self._on_click)
@@ -49,23 +57,22 @@ class Recorder:
     # Handlers
 
     def _elapsed_ms(self) -> int:
-        return int((time.time() - self._start_ts) * 1000)
+        return (time.monotonic_ns() - self._start_ns) // 1_000_000
 
     def _on_click(self, x: int, y: int, button, pressed: bool) -> None:
         if not self._running or not pressed:
             return
-        with self._lock:
-            aid = f"a{len(self._actions)+1}"
-            self._actions.append(Action(id=aid, type="mouse_click", target=None, params={"x": x, "y": y, "button": str(button).split(".")[-1]}))
+        aid = f"a{next(self._ids)}"
+        btn = _BUTTON_NAMES.get(button) or str(button).split(".")[-1]
+        self._actions.append(Action(id=aid, type="mouse_click", target=None, params={"x": x, "y": y, "button": btn}))
 
     def _on_key_press(self, key) -> None:
         if not self._running:
             return
-        with self._lock:
-            aid = f"a{len(self._actions)+1}"
-            # Convert key to string
-            try:
-                txt = key.char if hasattr(key, "char") and key.char else str(key)
-            except Exception:
-                txt = str(key)
-            self._actions.append(Action(id=aid, type="key_sequence", target=None, params={"sequence": [txt]}))
\ No newline at end of file
+        aid = f"a{next(self._ids)}"
+        # Printable keys record their character; special keys their "Key.<name>" form
+        if key.__class__ is keyboard.KeyCode:
+            txt = key.char or str(key)
+        else:
+            txt = _KEY_NAMES.get(key) or getattr(key, "char", None) or str(key)
+        self._actions.append(Action(id=aid, type="key_sequence", target=None, params={"sequence": [txt]}))
\ No newline at end of file
@@ -2,10 +2,18 @@ from __future__ import annotations
 
 import numpy as np
 
+# numba is optional; past this many boxes the compiled loop beats the array version
+try:
+    from autoclick_pro.util.nms_numba import nms_fast
+except ImportError:
+    nms_fast = None
+_NUMBA_MIN_BOXES = 256
+
 
 def iou(box_a: np.ndarray, box_b: np.ndarray) -> float:
     """
     Intersection over Union for axis-aligned boxes in format [x, y, w, h].
+    Single-pair helper; non_max_suppression computes IoU for all boxes at once.
     """
     ax, ay, aw, ah = box_a
     bx, by, bw, bh = box_b
@@ -25,19 +33,23 @@ def non_max_suppression(boxes: np.ndarray, scores: np.ndarray, iou_threshold: fl
     """
     if boxes.size == 0:
         return []
+    if nms_fast is not None and boxes.shape[0] >= _NUMBA_MIN_BOXES:
+        return nms_fast(boxes, scores, iou_threshold)
+    b = np.asarray(boxes, dtype=np.float64)
+    x1, y1 = b[:, 0], b[:, 1]
+    x2, y2 = x1 + b[:, 2], y1 + b[:, 3]
+    areas = b[:, 2] * b[:, 3]
     idxs = scores.argsort()[::-1]
     keep: list[int] = []
     while idxs.size > 0:
         i = int(idxs[0])
         keep.append(i)
-        if idxs.size == 1:
-            break
         rest = idxs[1:]
-        suppr = []
-        bi = boxes[i]
-        for j in rest:
-            bj = boxes[int(j)]
-            if iou(bi, bj) > iou_threshold:
-                suppr.append(int(j))
-        idxs = np.array([k for k in rest if int(k) not in suppr], dtype=int)
+        # IoU of the pivot against every remaining box in one pass
+        w = np.clip(np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]), 0, None)
+        h = np.clip(np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]), 0, None)
+        inter = w * h
+        union = areas[i] + areas[rest] - inter
+        ovr = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+        idxs = rest[ovr <= iou_threshold]
     return keep
\ No newline at end of file
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _greedy_nms(x1, y1, x2, y2, areas, order, iou_threshold):
+    n = order.shape[0]
+    suppressed = np.zeros(n, dtype=np.bool_)
+    keep = np.empty(n, dtype=np.int64)
+    k = 0
+    for a in range(n):
+        if suppressed[a]:
+            continue
+        i = order[a]
+        keep[k] = i
+        k += 1
+        for b in range(a + 1, n):
+            if suppressed[b]:
+                continue
+            j = order[b]
+            w = max(min(x2[i], x2[j]) - max(x1[i], x1[j]), 0.0)
+            h = max(min(y2[i], y2[j]) - max(y1[i], y1[j]), 0.0)
+            inter = w * h
+            union = areas[i] + areas[j] - inter
+            ovr = inter / union if union > 0 else 0.0
+            if ovr > iou_threshold:
+                suppressed[b] = True
+    return keep[:k]
+
+
+def nms_fast(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float = 0.3) -> list[int]:
+    """
+    Greedy NMS as one compiled loop with a suppressed mask and no per-step
+    temporaries. Same results as non_max_suppression, which calls it for large inputs.
+    """
+    b = np.asarray(boxes, dtype=np.float64)
+    x1, y1 = np.ascontiguousarray(b[:, 0]), np.ascontiguousarray(b[:, 1])
+    x2, y2 = x1 + b[:, 2], y1 + b[:, 3]
+    areas = b[:, 2] * b[:, 3]
+    order = np.ascontiguousarray(scores.argsort()[::-1])
+    return _greedy_nms(x1, y1, x2, y2, areas, order, float(iou_threshold)).tolist()
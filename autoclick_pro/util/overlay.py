@@ -4,41 +4,96 @@ from pathlib import Path
 from typing import Iterable, Tuple
 
 import cv2
+import numpy as np
 
 
-def annotate_detection(screenshot_path: Path, bbox: Tuple[int, int, int, int] | None, score: float, out_path: Path | None = None) -> Path:
+def _outline(img: np.ndarray, x: int, y: int, w: int, h: int, color: Tuple[int, int, int], t: int = 2) -> None:
+    """2px box as four slice fills, clipped to the image; cheaper than cv2.rectangle for thin outlines."""
+    ih, iw = img.shape[:2]
+    x0, y0, x1, y1 = max(x, 0), max(y, 0), min(x + w, iw), min(y + h, ih)
+    if x0 >= x1 or y0 >= y1:
+        return
+    img[y0 : min(y0 + t, y1), x0:x1] = color
+    img[max(y1 - t, y0) : y1, x0:x1] = color
+    img[y0:y1, x0 : min(x0 + t, x1)] = color
+    img[y0:y1, max(x1 - t, x0) : x1] = color
+
+
+def draw_detection(img: np.ndarray, bbox: Tuple[int, int, int, int] | None, score: float) -> np.ndarray:
     """
-    Draw bbox and score onto screenshot and save to out_path.
+    Draw bbox and score onto a BGR image in place and return it.
     """
-    img = cv2.imread(str(screenshot_path))
-    if img is None:
-        raise RuntimeError(f"Failed to load screenshot: {screenshot_path}")
     if bbox is not None:
         x, y, w, h = bbox
-        cv2.rectangle(img, (x, y), (x + w, y + h), (80, 180, 255), 2)
+        _outline(img, x, y, w, h, (80, 180, 255))
         label = f"score={score:.3f}"
         cv2.putText(img, label, (x, max(0, y - 8)), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (80, 180, 255), 1, cv2.LINE_AA)
     else:
         cv2.putText(img, "No match", (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (80, 80, 80), 2, cv2.LINE_AA)
-    out = out_path or (Path("screens") / "annotated.png")
-    out.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(out), img)
-    return out
+    return img
 
 
-def annotate_candidates(screenshot_path: Path, candidates: Iterable[tuple[tuple[int, int, int, int], float]], out_path: Path | None = None) -> Path:
+def draw_candidates(img: np.ndarray, candidates: Iterable[tuple[tuple[int, int, int, int], float]]) -> np.ndarray:
     """
-    Draw multiple candidate boxes and scores on screenshot.
+    Draw multiple candidate boxes and scores onto a BGR image in place and return it.
     """
-    img = cv2.imread(str(screenshot_path))
-    if img is None:
-        raise RuntimeError(f"Failed to load screenshot: {screenshot_path}")
     for idx, (bbox, score) in enumerate(candidates, start=1):
         x, y, w, h = bbox
         color = (80, 180, 255) if idx == 1 else (120, 220, 120)
-        cv2.rectangle(img, (x, y), (x + w, y + h), color, 2)
+        _outline(img, x, y, w, h, color)
         cv2.putText(img, f"{idx}:{score:.3f}", (x, max(0, y - 8)), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1, cv2.LINE_AA)
-    out = out_path or (Path("screens") / "annotated_multi.png")
+    return img
+
+
+def _load_screenshot(screenshot_path: Path, image: np.ndarray | None) -> np.ndarray:
+    if image is not None:
+        return image.copy()
+    img = cv2.imread(str(screenshot_path))
+    if img is None:
+        raise RuntimeError(f"Failed to load screenshot: {screenshot_path}")
+    return img
+
+
+def _write_overlay(out: Path, img: np.ndarray) -> None:
+    # Overlays are throwaway debug frames: quality-85 JPEG, or PNG at the fastest deflate level
+    if out.suffix.lower() in (".jpg", ".jpeg"):
+        params = [cv2.IMWRITE_JPEG_QUALITY, 85]
+    else:
+        params = [cv2.IMWRITE_PNG_COMPRESSION, 1]
     out.parent.mkdir(parents=True, exist_ok=True)
-    cv2.imwrite(str(out), img)
+    cv2.imwrite(str(out), img, params)
+
+
+def annotate_detection(
+    screenshot_path: Path,
+    bbox: Tuple[int, int, int, int] | None,
+    score: float,
+    out_path: Path | None = None,
+    image: np.ndarray | None = None,
+) -> Path:
+    """
+    Draw bbox and score onto screenshot and save to out_path. Pass an already
+    captured BGR `image` to skip reading screenshot_path; it is not modified.
+    """
+    img = _load_screenshot(screenshot_path, image)
+    draw_detection(img, bbox, score)
+    out = out_path or (Path("screens") / "annotated.png")
+    _write_overlay(out, img)
+    return out
+
+
+def annotate_candidates(
+    screenshot_path: Path,
+    candidates: Iterable[tuple[tuple[int, int, int, int], float]],
+    out_path: Path | None = None,
+    image: np.ndarray | None = None,
+) -> Path:
+    """
+    Draw multiple candidate boxes and scores on screenshot. As with
+    annotate_detection, `image` replaces reading screenshot_path.
+    """
+    img = _load_screenshot(screenshot_path, image)
+    draw_candidates(img, candidates)
+    out = out_path or (Path("screens") / "annotated_multi.png")
+    _write_overlay(out, img)
     return out
\ No newline at end of file
@@ -1,11 +1,50 @@
 from __future__ import annotations
 
+import atexit
+import threading
 from pathlib import Path
 from typing import Tuple
 
+import cv2
 import numpy as np
 from mss import mss
-from PIL import Image
+from mss.tools import to_png
+
+
+class _Handle:
+    """An mss handle owned by one thread; closed when that thread's locals are torn down."""
+    __slots__ = ("sct",)
+
+    def __init__(self) -> None:
+        self.sct = mss()
+
+    def __del__(self) -> None:
+        self.sct.close()
+
+
+# mss handles are bound to the thread that opened them, so each capturing
+# thread keeps one for its lifetime instead of reopening per grab. Worker
+# threads close theirs as they exit; the main thread's is dropped at exit.
+_tls = threading.local()
+
+
+def _sct():
+    handle = getattr(_tls, "handle", None)
+    if handle is None:
+        handle = _tls.handle = _Handle()
+    return handle.sct
+
+
+@atexit.register
+def _close_main_handle() -> None:
+    if getattr(_tls, "handle", None) is not None:
+        del _tls.handle
+
+
+def primary_monitor() -> Tuple[int, int, int, int]:
+    """(x, y, w, h) of the primary monitor, e.g. for grab_region_gray."""
+    mon = _sct().monitors[1]
+    return mon["left"], mon["top"], mon["width"], mon["height"]
 
 
 def grab_screen(out_path: Path | None = None) -> Path:
@@ -15,16 +54,35 @@ def grab_screen(out_path: Path | None = None) -> Path:
     """
     out = out_path or Path("screens") / "screen.png"
     out.parent.mkdir(parents=True, exist_ok=True)
-    with mss() as sct:
-        mon = sct.monitors[1]
-        img = sct.grab(mon)
-        Image.frombytes("RGB", img.size, img.rgb).save(out)
+    sct = _sct()
+    img = sct.grab(sct.monitors[1])
+    to_png(img.rgb, img.size, output=str(out))
     return out
 
 
+def grab_screen_array(dst: np.ndarray | None = None) -> np.ndarray:
+    """
+    Capture the primary screen as an in-memory BGR array (no PNG round-trip),
+    ready for the *_array matchers and overlay drawing. A `dst` of the right
+    shape is filled in place instead of allocating a new frame.
+    """
+    sct = _sct()
+    raw = np.asarray(sct.grab(sct.monitors[1]))
+    return cv2.cvtColor(raw, cv2.COLOR_BGRA2BGR, dst=dst)
+
+
+def grab_region_gray(x: int, y: int, w: int, h: int, dst: np.ndarray | None = None) -> np.ndarray:
+    """
+    Capture a screen region straight to a grayscale array for the matchers:
+    one BGRA->GRAY conversion over the mss buffer, no file and no BGR step.
+    `dst` works as in grab_screen_array.
+    """
+    raw = np.asarray(_sct().grab({"top": y, "left": x, "width": w, "height": h}))
+    return cv2.cvtColor(raw, cv2.COLOR_BGRA2GRAY, dst=dst)
+
+
 def grab_region(x: int, y: int, w: int, h: int, out_path: Path) -> Path:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with mss() as sct:
-        img = sct.grab({"top": y, "left": x, "width": w, "height": h})
-        Image.frombytes("RGB", img.size, img.rgb).save(out_path)
+    img = _sct().grab({"top": y, "left": x, "width": w, "height": h})
+    to_png(img.rgb, img.size, output=str(out_path))
     return out_path
\ No newline at end of file